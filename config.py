@@ -1,21 +1,49 @@
+import asyncio
 import os
-from typing import Optional
+import re
+import functools
+from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
 import json
 
 
+# KEY=value lines; blank lines and lines starting with '#' never match
+# (a trailing '\r' from CRLF files is trimmed with the whitespace, before quotes are stripped)
+_ENV_LINE = re.compile(r'^[ \t]*([^#\s=][^=\r\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.MULTILINE)
+
+# (mtime_ns, size) of each .env file at the time it was last loaded
+_loaded_env_files: Dict[str, Tuple[int, int]] = {}
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for a file, or None if it does not exist"""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=8)
+def _read_json_file(path: str, signature: Tuple[int, int]) -> Dict[str, Any]:
+    """Parse a JSON file; cached until the file's signature changes"""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
 def load_env_file(env_path: str = ".env") -> None:
     """Load environment variables from .env file"""
     env_file = Path(env_path)
-    if env_file.exists():
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")  # Remove quotes
-                    os.environ[key] = value
+    signature = _file_signature(env_file)
+    if signature is None or _loaded_env_files.get(env_path) == signature:
+        return
+    
+    _loaded_env_files[env_path] = signature
+    text = env_file.read_text()
+    os.environ.update({
+        key: value.strip('"').strip("'")  # Remove quotes
+        for key, value in _ENV_LINE.findall(text)
+    })
 
 
 class SpotifyConfig:
@@ -26,16 +54,18 @@ class SpotifyConfig:
         self.client_id: Optional[str] = None
         self.client_secret: Optional[str] = None
         self.redirect_uri: str = "http://127.0.0.1:8000/callback"
-        self.scopes = [
+        self.scopes = (
             "playlist-read-private",
             "playlist-read-collaborative", 
             "user-read-private",
             "user-read-email"
-        ]
+        )
         self.load_config()
     
     def load_config(self) -> None:
         """Load configuration from file or environment variables"""
+        self.__dict__.pop("scope_string", None)
+        
         # Load .env file first
         load_env_file()
         
@@ -49,14 +79,14 @@ class SpotifyConfig:
             self.redirect_uri = env_redirect_uri
         
         # Override with config file if it exists
-        if self.config_file.exists():
+        signature = _file_signature(self.config_file)
+        if signature is not None:
             try:
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
-                    self.client_id = config_data.get("client_id", self.client_id)
-                    self.client_secret = config_data.get("client_secret", self.client_secret)
-                    self.redirect_uri = config_data.get("redirect_uri", self.redirect_uri)
-                    self.scopes = config_data.get("scopes", self.scopes)
+                config_data = _read_json_file(str(self.config_file), signature)
+                self.client_id = config_data.get("client_id", self.client_id)
+                self.client_secret = config_data.get("client_secret", self.client_secret)
+                self.redirect_uri = config_data.get("redirect_uri", self.redirect_uri)
+                self.scopes = tuple(config_data.get("scopes", self.scopes))
             except (json.JSONDecodeError, FileNotFoundError) as e:
                 print(f"Warning: Could not load config file: {e}")
     
@@ -66,7 +96,7 @@ class SpotifyConfig:
             "client_id": client_id,
             "client_secret": client_secret,
             "redirect_uri": self.redirect_uri,
-            "scopes": self.scopes
+            "scopes": list(self.scopes)
         }
         
         with open(self.config_file, 'w') as f:
@@ -75,14 +105,20 @@ class SpotifyConfig:
         # Update instance variables
         self.client_id = client_id
         self.client_secret = client_secret
+        self.__dict__.pop("scope_string", None)
     
     def is_configured(self) -> bool:
         """Check if all required configuration is present"""
         return bool(self.client_id and self.client_secret)
     
+    @functools.cached_property
+    def scope_string(self) -> str:
+        """Scopes as a space-separated string, joined once per loaded config"""
+        return " ".join(self.scopes)
+    
     def get_scope_string(self) -> str:
         """Get scopes as space-separated string"""
-        return " ".join(self.scopes)
+        return self.scope_string
     
     def setup_interactive(self) -> None:
         """Interactive setup for Spotify credentials"""
@@ -129,13 +165,13 @@ class TokenManager:
     
     def load_tokens(self) -> None:
         """Load tokens from file"""
-        if self.token_file.exists():
+        signature = _file_signature(self.token_file)
+        if signature is not None:
             try:
-                with open(self.token_file, 'r') as f:
-                    token_data = json.load(f)
-                    self.access_token = token_data.get("access_token")
-                    self.refresh_token = token_data.get("refresh_token")
-                    self.expires_at = token_data.get("expires_at")
+                token_data = _read_json_file(str(self.token_file), signature)
+                self.access_token = token_data.get("access_token")
+                self.refresh_token = token_data.get("refresh_token")
+                self.expires_at = token_data.get("expires_at")
             except (json.JSONDecodeError, FileNotFoundError) as e:
                 print(f"Warning: Could not load tokens: {e}")
     
@@ -156,6 +192,10 @@ class TokenManager:
         with open(self.token_file, 'w') as f:
             json.dump(token_data, f, indent=2)
     
+    async def save_tokens_async(self, access_token: str, refresh_token: str, expires_in: int) -> None:
+        """Save tokens to file without blocking the event loop"""
+        await asyncio.to_thread(self.save_tokens, access_token, refresh_token, expires_in)
+    
     def is_token_valid(self) -> bool:
         """Check if current access token is valid"""
         if not self.access_token or not self.expires_at:
@@ -1,5 +1,6 @@
 import csv
-from typing import List
+import io
+from typing import Iterable, Iterator, List, Tuple
 from services.base import PlaylistExporter
 from models import Playlist
 
@@ -7,6 +8,19 @@ from models import Playlist
 class CSVExporter(PlaylistExporter):
     """Export playlists to CSV format"""
     
+    FIELDNAMES = (
+        'playlist_id', 'playlist_name', 'playlist_description', 'playlist_type',
+        'playlist_public', 'playlist_collaborative', 'playlist_owner',
+        'playlist_follower_count', 'playlist_track_count', 'playlist_duration_ms',
+        'track_id', 'track_name', 'track_uri', 'track_duration_ms', 'track_explicit',
+        'track_popularity', 'track_number', 'disc_number', 'track_isrc',
+        'track_added_at', 'artist_names', 'album_name', 'album_release_date',
+        'album_type', 'spotify_playlist_url', 'spotify_track_url'
+    )
+    
+    # 1 MiB write buffer keeps large exports to few, large write syscalls
+    WRITE_BUFFER_SIZE = 1 << 20
+    
     @property
     def file_extension(self) -> str:
         return "csv"
@@ -23,53 +37,65 @@ class CSVExporter(PlaylistExporter):
         """Export multiple playlists to CSV"""
         self._write_csv(file_path, playlists)
     
-    def _write_csv(self, file_path: str, playlists: List[Playlist]) -> None:
+    def stream_export(self, playlists: Iterable[Playlist], file_path: str) -> None:
+        """Export playlists from any iterable to CSV as they arrive"""
+        self._write_csv(file_path, playlists)
+    
+    def _write_csv(self, file_path: str, playlists: Iterable[Playlist]) -> None:
         """Write playlists to CSV file"""
-        fieldnames = [
-            'playlist_id', 'playlist_name', 'playlist_description', 'playlist_type',
-            'playlist_public', 'playlist_collaborative', 'playlist_owner',
-            'playlist_follower_count', 'playlist_track_count', 'playlist_duration_ms',
-            'track_id', 'track_name', 'track_uri', 'track_duration_ms', 'track_explicit',
-            'track_popularity', 'track_number', 'disc_number', 'track_isrc',
-            'track_added_at', 'artist_names', 'album_name', 'album_release_date',
-            'album_type', 'spotify_playlist_url', 'spotify_track_url'
-        ]
-        
-        with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
+        with open(file_path, 'w', newline='', encoding='utf-8', buffering=self.WRITE_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(self.FIELDNAMES)
             
+            write = csvfile.write
+            writerow = writer.writerow
             for playlist in playlists:
-                for track in playlist.tracks:
-                    artist_names = ', '.join([artist.name for artist in track.artists])
-                    
-                    row = {
-                        'playlist_id': playlist.id,
-                        'playlist_name': playlist.name,
-                        'playlist_description': playlist.description or '',
-                        'playlist_type': playlist.playlist_type.value,
-                        'playlist_public': playlist.public,
-                        'playlist_collaborative': playlist.collaborative,
-                        'playlist_owner': playlist.owner.display_name,
-                        'playlist_follower_count': playlist.follower_count,
-                        'playlist_track_count': playlist.track_count,
-                        'playlist_duration_ms': playlist.total_duration_ms,
-                        'track_id': track.id,
-                        'track_name': track.name,
-                        'track_uri': track.uri,
-                        'track_duration_ms': track.duration_ms,
-                        'track_explicit': track.explicit,
-                        'track_popularity': track.popularity,
-                        'track_number': track.track_number,
-                        'disc_number': track.disc_number,
-                        'track_isrc': track.isrc or '',
-                        'track_added_at': track.added_at.isoformat() if track.added_at else '',
-                        'artist_names': artist_names,
-                        'album_name': track.album.name,
-                        'album_release_date': track.album.release_date,
-                        'album_type': track.album.album_type,
-                        'spotify_playlist_url': playlist.external_urls.get('spotify', ''),
-                        'spotify_track_url': track.external_urls.get('spotify', '')
-                    }
-                    
-                    writer.writerow(row)
\ No newline at end of file
+                # Playlist columns repeat on every track row, so quote them once and
+                # write the finished text ahead of each track's columns
+                prefix = self._playlist_prefix(playlist)
+                for row in self._track_rows(playlist):
+                    write(prefix)
+                    writerow(row)
+    
+    def _playlist_prefix(self, playlist: Playlist) -> str:
+        """CSV-encode the leading playlist columns, ending with a field separator"""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow((
+            playlist.id,
+            playlist.name,
+            playlist.description or '',
+            playlist.playlist_type.value,
+            playlist.public,
+            playlist.collaborative,
+            playlist.owner.display_name,
+            playlist.follower_count,
+            playlist.track_count,
+            playlist.total_duration_ms,
+        ))
+        # Encode with the default '\r\n' terminator so embedded newlines get quoted
+        return buffer.getvalue()[:-2] + ','
+    
+    def _track_rows(self, playlist: Playlist) -> Iterator[Tuple]:
+        """Yield the remaining columns for each track, in FIELDNAMES order"""
+        playlist_url = playlist.external_urls.get('spotify', '')
+        
+        for track in playlist.tracks:
+            album = track.album
+            yield (
+                track.id,
+                track.name,
+                track.uri,
+                track.duration_ms,
+                track.explicit,
+                track.popularity,
+                track.track_number,
+                track.disc_number,
+                track.isrc or '',
+                track.added_at.isoformat() if track.added_at else '',
+                ', '.join(artist.name for artist in track.artists),
+                album.name,
+                album.release_date,
+                album.album_type,
+                playlist_url,
+                track.external_urls.get('spotify', ''),
+            )
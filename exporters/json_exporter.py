@@ -1,13 +1,125 @@
 import json
-from typing import List, Dict, Any
+import typing
+from typing import List, Dict, Any, Callable, Iterable, Optional, Tuple, Union
 from datetime import datetime
+from enum import Enum
 from services.base import PlaylistExporter
-from models import Playlist, Track, Artist, Album
+from models import Playlist, PlaylistOwner, Track, Artist, Album
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+# Output key and source attribute for each exported model, in output order
+_EXPORT_FIELDS: Dict[type, Tuple[Tuple[str, str], ...]] = {
+    Playlist: (
+        ("id", "id"), ("name", "name"), ("description", "description"),
+        ("uri", "uri"), ("type", "playlist_type"), ("public", "public"),
+        ("collaborative", "collaborative"), ("owner", "owner"),
+        ("follower_count", "follower_count"), ("track_count", "track_count"),
+        ("total_duration_ms", "total_duration_ms"),
+        ("unique_artists", "unique_artists"), ("images", "images"),
+        ("external_urls", "external_urls"), ("snapshot_id", "snapshot_id"),
+        ("created_at", "created_at"), ("modified_at", "modified_at"),
+        ("tracks", "tracks"),
+    ),
+    PlaylistOwner: (
+        ("id", "id"), ("display_name", "display_name"), ("uri", "uri"),
+        ("external_urls", "external_urls"),
+    ),
+    Track: (
+        ("id", "id"), ("name", "name"), ("uri", "uri"), ("type", "track_type"),
+        ("duration_ms", "duration_ms"), ("explicit", "explicit"),
+        ("popularity", "popularity"), ("preview_url", "preview_url"),
+        ("track_number", "track_number"), ("disc_number", "disc_number"),
+        ("isrc", "isrc"), ("added_at", "added_at"),
+        ("added_by_user_id", "added_by_user_id"), ("artists", "artists"),
+        ("album", "album"), ("external_urls", "external_urls"),
+    ),
+    Artist: (
+        ("id", "id"), ("name", "name"), ("uri", "uri"),
+        ("external_urls", "external_urls"),
+    ),
+    Album: (
+        ("id", "id"), ("name", "name"), ("uri", "uri"),
+        ("release_date", "release_date"), ("album_type", "album_type"),
+        ("artists", "artists"), ("images", "images"),
+        ("external_urls", "external_urls"),
+    ),
+}
+
+
+# Specialized serializer function per model class, generated on first use
+_serializers: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+
+
+def _serializer_name(cls: type) -> str:
+    return f"_serialize_{cls.__name__}"
+
+
+def _field_expression(attr: str, hint: Any, namespace: Dict[str, Any]) -> str:
+    """Source expression that reads and converts one field of object `o`"""
+    value = f"o.{attr}"
+    if typing.get_origin(hint) is Union:
+        inner = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+        # orjson writes datetimes in the same ISO 8601 form as isoformat()
+        if inner == [datetime] and orjson is None:
+            return f"(None if {value} is None else {value}.isoformat())"
+        return value
+    if typing.get_origin(hint) is list:
+        args = typing.get_args(hint)
+        if args and args[0] in _EXPORT_FIELDS:
+            namespace[_serializer_name(args[0])] = _get_serializer(args[0])
+            return f"[{_serializer_name(args[0])}(v) for v in {value}]"
+        return value
+    if hint in _EXPORT_FIELDS:
+        namespace[_serializer_name(hint)] = _get_serializer(hint)
+        return f"{_serializer_name(hint)}({value})"
+    # orjson writes enums as their value natively
+    if isinstance(hint, type) and issubclass(hint, Enum) and orjson is None:
+        return f"{value}.value"
+    return value
+
+
+def _compile_serializer(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Generate a function that builds the export dict for `cls` as a single dict literal.
+    Model shapes are fixed, so the field walk and type checks happen once here
+    instead of on every object.
+    """
+    hints = typing.get_type_hints(cls)
+    namespace: Dict[str, Any] = {}
+    items = ",\n        ".join(
+        f"{key!r}: {_field_expression(attr, hints.get(attr), namespace)}"
+        for key, attr in _EXPORT_FIELDS[cls]
+    )
+    name = _serializer_name(cls)
+    source = f"def {name}(o):\n    return {{\n        {items},\n    }}\n"
+    exec(compile(source, f"<{name}>", "exec"), namespace)
+    return namespace[name]
+
+
+def _get_serializer(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    serializer = _serializers.get(cls)
+    if serializer is None:
+        serializer = _serializers[cls] = _compile_serializer(cls)
+    return serializer
+
+
+def _to_dict(obj: Any) -> Dict[str, Any]:
+    """Convert a model object to a serializable dictionary"""
+    return _get_serializer(type(obj))(obj)
 
 
 class JSONExporter(PlaylistExporter):
     """Export playlists to JSON format"""
     
+    # Multi-playlist exports issue one write per playlist; buffer them into large chunks.
+    # Single-playlist files use the same size so a typical playlist never flushes early.
+    WRITE_BUFFER_SIZE = 1 << 20
+    
     @property
     def file_extension(self) -> str:
         return "json"
@@ -19,88 +131,58 @@ class JSONExporter(PlaylistExporter):
     def export_playlist(self, playlist: Playlist, file_path: str) -> None:
         """Export a single playlist to JSON"""
         playlist_data = self._serialize_playlist(playlist)
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(playlist_data, f, indent=2, ensure_ascii=False, default=str)
+        self._write_json(file_path, playlist_data)
     
     def export_playlists(self, playlists: List[Playlist], file_path: str) -> None:
-        """Export multiple playlists to JSON"""
-        export_data = {
-            "export_timestamp": datetime.now().isoformat(),
-            "total_playlists": len(playlists),
-            "playlists": [self._serialize_playlist(p) for p in playlists]
-        }
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
+        """Export multiple playlists to JSON, writing one playlist at a time"""
+        self._write_export(file_path, (self._serialize_playlist(p) for p in playlists), len(playlists))
     
-    def _serialize_playlist(self, playlist: Playlist) -> Dict[str, Any]:
-        """Convert playlist to serializable dictionary"""
-        return {
-            "id": playlist.id,
-            "name": playlist.name,
-            "description": playlist.description,
-            "uri": playlist.uri,
-            "type": playlist.playlist_type.value,
-            "public": playlist.public,
-            "collaborative": playlist.collaborative,
-            "owner": {
-                "id": playlist.owner.id,
-                "display_name": playlist.owner.display_name,
-                "uri": playlist.owner.uri,
-                "external_urls": playlist.owner.external_urls
-            },
-            "follower_count": playlist.follower_count,
-            "track_count": playlist.track_count,
-            "total_duration_ms": playlist.total_duration_ms,
-            "unique_artists": playlist.unique_artists,
-            "images": playlist.images,
-            "external_urls": playlist.external_urls,
-            "snapshot_id": playlist.snapshot_id,
-            "created_at": playlist.created_at.isoformat() if playlist.created_at else None,
-            "modified_at": playlist.modified_at.isoformat() if playlist.modified_at else None,
-            "tracks": [self._serialize_track(track) for track in playlist.tracks]
-        }
+    def stream_export(self, playlists: Iterable[Playlist], file_path: str) -> None:
+        """
+        Export playlists from any iterable, serializing each as it arrives.
+        total_playlists is written after the playlists since the count isn't known up front.
+        """
+        self._write_export(file_path, (self._serialize_playlist(p) for p in playlists), None)
+    
+    def _write_export(
+        self,
+        file_path: str,
+        playlist_dicts: Iterable[Dict[str, Any]],
+        total_playlists: Optional[int]
+    ) -> None:
+        """Write the multi-playlist export document, encoding one playlist at a time"""
+        encode = self._encode
+        
+        with open(file_path, 'wb', buffering=self.WRITE_BUFFER_SIZE) as f:
+            f.write(b'{\n  "export_timestamp": ' + encode(datetime.now().isoformat()) + b',\n')
+            if total_playlists is not None:
+                f.write(b'  "total_playlists": ' + encode(total_playlists) + b',\n')
+            f.write(b'  "playlists": [')
+            
+            # Each playlist is encoded on its own and shifted two levels deep, so
+            # the file matches a single indented dump of the whole export
+            count = 0
+            for playlist_data in playlist_dicts:
+                f.write(b',\n    ' if count else b'\n    ')
+                f.write(encode(playlist_data).replace(b'\n', b'\n    '))
+                count += 1
+            
+            f.write(b'\n  ]' if count else b']')
+            if total_playlists is None:
+                f.write(b',\n  "total_playlists": ' + encode(count))
+            f.write(b'\n}')
     
-    def _serialize_track(self, track: Track) -> Dict[str, Any]:
-        """Convert track to serializable dictionary"""
-        return {
-            "id": track.id,
-            "name": track.name,
-            "uri": track.uri,
-            "type": track.track_type.value,
-            "duration_ms": track.duration_ms,
-            "explicit": track.explicit,
-            "popularity": track.popularity,
-            "preview_url": track.preview_url,
-            "track_number": track.track_number,
-            "disc_number": track.disc_number,
-            "isrc": track.isrc,
-            "added_at": track.added_at.isoformat() if track.added_at else None,
-            "added_by_user_id": track.added_by_user_id,
-            "artists": [self._serialize_artist(artist) for artist in track.artists],
-            "album": self._serialize_album(track.album),
-            "external_urls": track.external_urls
-        }
+    def _encode(self, data: Any) -> bytes:
+        """Encode data as indented UTF-8 JSON, using orjson when available"""
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
+        return json.dumps(data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
     
-    def _serialize_artist(self, artist: Artist) -> Dict[str, Any]:
-        """Convert artist to serializable dictionary"""
-        return {
-            "id": artist.id,
-            "name": artist.name,
-            "uri": artist.uri,
-            "external_urls": artist.external_urls
-        }
+    def _write_json(self, file_path: str, data: Dict[str, Any]) -> None:
+        """Write data to a UTF-8 JSON file in a single write"""
+        with open(file_path, 'wb', buffering=self.WRITE_BUFFER_SIZE) as f:
+            f.write(self._encode(data))
     
-    def _serialize_album(self, album: Album) -> Dict[str, Any]:
-        """Convert album to serializable dictionary"""
-        return {
-            "id": album.id,
-            "name": album.name,
-            "uri": album.uri,
-            "release_date": album.release_date,
-            "album_type": album.album_type,
-            "artists": [self._serialize_artist(artist) for artist in album.artists],
-            "images": album.images,
-            "external_urls": album.external_urls
-        }
\ No newline at end of file
+    def _serialize_playlist(self, playlist: Playlist) -> Dict[str, Any]:
+        """Convert playlist to serializable dictionary"""
+        return _to_dict(playlist)
@@ -1,8 +1,14 @@
-import asyncio
 from typing import List, Dict, Optional
 from services.base import MusicService
 from models import Playlist, PlaylistType
-from datetime import datetime
+
+
+# Menu choice -> playlist type for "Select by type"
+_TYPE_MAP = {
+    "1": PlaylistType.OWNED,
+    "2": PlaylistType.FOLLOWED,
+    "3": PlaylistType.COLLABORATIVE
+}
 
 
 class PlaylistSelector:
@@ -11,32 +17,55 @@ class PlaylistSelector:
     def __init__(self, music_service: MusicService):
         self.music_service = music_service
         self.playlists: List[Playlist] = []
+        self._by_type: Dict[PlaylistType, List[Playlist]] = {}
+        self._display_rows: Optional[List[str]] = None
     
     async def load_playlists(self) -> None:
         """Load all user playlists from the music service"""
         print(f"Loading playlists from {self.music_service.service_name}...")
         self.playlists = await self.music_service.get_user_playlists()
+        self._index_by_type()
+        self._display_rows = None
         print(f"Found {len(self.playlists)} playlists")
     
+    def _index_by_type(self) -> None:
+        """Group loaded playlists by type so type filters don't rescan the list"""
+        self._by_type = {}
+        for playlist in self.playlists:
+            self._by_type.setdefault(playlist.playlist_type, []).append(playlist)
+    
     def display_playlists(self) -> None:
         """Display all playlists in a formatted table"""
         if not self.playlists:
             print("No playlists found.")
             return
         
-        print("\n" + "="*100)
-        print(f"{'#':<3} {'Name':<30} {'Type':<12} {'Tracks':<8} {'Public':<8} {'Owner':<20}")
-        print("="*100)
-        
-        for i, playlist in enumerate(self.playlists, 1):
-            playlist_type = playlist.playlist_type.value
-            track_count = len(playlist.tracks)
-            public_status = "Yes" if playlist.public else "No"
-            owner_name = playlist.owner.display_name[:19]
-            
-            print(f"{i:<3} {playlist.name[:29]:<30} {playlist_type:<12} {track_count:<8} {public_status:<8} {owner_name:<20}")
+        if self._display_rows is None:
+            self._display_rows = self._build_display_rows()
         
-        print("="*100)
+        # One write for the whole table instead of one print per row
+        print("\n".join([
+            "\n" + "="*100,
+            f"{'#':<3} {'Name':<30} {'Type':<12} {'Tracks':<8} {'Public':<8} {'Owner':<20}",
+            "="*100,
+            *self._display_rows,
+            "="*100
+        ]))
+    
+    def _build_display_rows(self) -> List[str]:
+        """Format one table row per loaded playlist; reused until playlists reload"""
+        row = "{:<3} {:<30} {:<12} {:<8} {:<8} {:<20}".format
+        return [
+            row(
+                i,
+                playlist.name[:29],
+                playlist.playlist_type.value,
+                len(playlist.tracks),
+                "Yes" if playlist.public else "No",
+                playlist.owner.display_name[:19]
+            )
+            for i, playlist in enumerate(self.playlists, 1)
+        ]
     
     def display_playlist_details(self, playlist_index: int) -> None:
         """Display detailed information about a specific playlist"""
@@ -46,35 +75,39 @@ class PlaylistSelector:
         
         playlist = self.playlists[playlist_index]
         
-        print(f"\n{'='*80}")
-        print(f"Playlist: {playlist.name}")
-        print(f"{'='*80}")
-        print(f"Description: {playlist.description or 'No description'}")
-        print(f"Owner: {playlist.owner.display_name}")
-        print(f"Type: {playlist.playlist_type.value}")
-        print(f"Public: {'Yes' if playlist.public else 'No'}")
-        print(f"Collaborative: {'Yes' if playlist.collaborative else 'No'}")
-        print(f"Followers: {playlist.follower_count:,}")
-        print(f"Total Tracks: {len(playlist.tracks)}")
-        print(f"Total Duration: {self._format_duration(playlist.total_duration_ms)}")
-        print(f"Unique Artists: {len(playlist.unique_artists)}")
+        # Collect every line first so long playlists render in a single write
+        lines = [
+            f"\n{'='*80}",
+            f"Playlist: {playlist.name}",
+            f"{'='*80}",
+            f"Description: {playlist.description or 'No description'}",
+            f"Owner: {playlist.owner.display_name}",
+            f"Type: {playlist.playlist_type.value}",
+            f"Public: {'Yes' if playlist.public else 'No'}",
+            f"Collaborative: {'Yes' if playlist.collaborative else 'No'}",
+            f"Followers: {playlist.follower_count:,}",
+            f"Total Tracks: {len(playlist.tracks)}",
+            f"Total Duration: {self._format_duration(playlist.total_duration_ms)}",
+            f"Unique Artists: {len(playlist.unique_artists)}"
+        ]
         
         if playlist.created_at:
-            print(f"Created: {playlist.created_at.strftime('%Y-%m-%d')}")
+            lines.append(f"Created: {playlist.created_at.strftime('%Y-%m-%d')}")
         if playlist.modified_at:
-            print(f"Last Modified: {playlist.modified_at.strftime('%Y-%m-%d')}")
+            lines.append(f"Last Modified: {playlist.modified_at.strftime('%Y-%m-%d')}")
         
-        print(f"\nTracks:")
-        print(f"{'#':<3} {'Title':<35} {'Artist':<25} {'Duration':<8}")
-        print("-" * 80)
+        lines.append(f"\nTracks:")
+        lines.append(f"{'#':<3} {'Title':<35} {'Artist':<25} {'Duration':<8}")
+        lines.append("-" * 80)
         
+        row = "{:<3} {:<35} {:<25} {:<8}".format
+        format_duration = self._format_duration
         for i, track in enumerate(playlist.tracks, 1):
-            artist_names = ", ".join([artist.name for artist in track.artists])
-            duration = self._format_duration(track.duration_ms)
-            
-            print(f"{i:<3} {track.name[:34]:<35} {artist_names[:24]:<25} {duration:<8}")
+            artist_names = ", ".join(artist.name for artist in track.artists)
+            lines.append(row(i, track.name[:34], artist_names[:24], format_duration(track.duration_ms)))
         
-        print(f"{'='*80}")
+        lines.append(f"{'='*80}")
+        print("\n".join(lines))
     
     def select_playlists_interactive(self) -> List[Playlist]:
         """Interactive playlist selection interface"""
@@ -82,7 +115,8 @@ class PlaylistSelector:
             print("No playlists available for selection.")
             return []
         
-        selected_playlists = []
+        # Keyed by playlist ID so repeated selections collapse, in selection order
+        selected_playlists: Dict[str, Playlist] = {}
         
         while True:
             print("\n" + "="*50)
@@ -108,33 +142,31 @@ class PlaylistSelector:
                 self._handle_playlist_details()
             elif choice == "3":
                 selected = self._handle_individual_selection()
-                selected_playlists.extend(selected)
+                self._add_to_selection(selected_playlists, selected)
             elif choice == "4":
                 selected = self._handle_type_selection()
-                selected_playlists.extend(selected)
+                self._add_to_selection(selected_playlists, selected)
             elif choice == "5":
-                selected_playlists = self.playlists.copy()
+                selected_playlists = {p.id: p for p in self.playlists}
                 print(f"Selected all {len(selected_playlists)} playlists")
             elif choice == "6":
-                self._display_selection(selected_playlists)
+                self._display_selection(list(selected_playlists.values()))
             elif choice == "7":
                 selected_playlists.clear()
                 print("Selection cleared")
             elif choice == "8":
                 if selected_playlists:
-                    # Remove duplicates by ID
-                    seen_ids = set()
-                    unique_playlists = []
-                    for playlist in selected_playlists:
-                        if playlist.id not in seen_ids:
-                            seen_ids.add(playlist.id)
-                            unique_playlists.append(playlist)
-                    return unique_playlists
+                    return list(selected_playlists.values())
                 else:
                     print("No playlists selected.")
             else:
                 print("Invalid choice. Please try again.")
     
+    def _add_to_selection(self, selected_playlists: Dict[str, Playlist], playlists: List[Playlist]) -> None:
+        """Add playlists to the selection, keeping the first occurrence of each ID"""
+        for playlist in playlists:
+            selected_playlists.setdefault(playlist.id, playlist)
+    
     def _handle_playlist_details(self) -> None:
         """Handle viewing playlist details"""
         self.display_playlists()
@@ -174,18 +206,13 @@ class PlaylistSelector:
         print("3. Collaborative playlists")
         
         type_choice = input("Select type (1-3): ").strip()
-        type_map = {
-            "1": PlaylistType.OWNED,
-            "2": PlaylistType.FOLLOWED,
-            "3": PlaylistType.COLLABORATIVE
-        }
         
-        if type_choice not in type_map:
+        if type_choice not in _TYPE_MAP:
             print("Invalid type selection")
             return []
         
-        selected_type = type_map[type_choice]
-        matching_playlists = [p for p in self.playlists if p.playlist_type == selected_type]
+        selected_type = _TYPE_MAP[type_choice]
+        matching_playlists = list(self._by_type.get(selected_type, ()))
         
         if matching_playlists:
             print(f"Selected {len(matching_playlists)} {selected_type.value} playlists:")
@@ -204,22 +231,15 @@ class PlaylistSelector:
         
         print(f"\nCurrently Selected Playlists ({len(selected_playlists)}):")
         print("-" * 50)
+        format_duration = self._format_duration
         for i, playlist in enumerate(selected_playlists, 1):
-            tracks = len(playlist.tracks)
-            duration = self._format_duration(playlist.total_duration_ms)
-            print(f"{i}. {playlist.name} ({tracks} tracks, {duration})")
+            duration = format_duration(playlist.total_duration_ms)
+            print(f"{i}. {playlist.name} ({len(playlist.tracks)} tracks, {duration})")
     
     def _format_duration(self, duration_ms: int) -> str:
-        """Format duration from milliseconds to human readable format"""
-        total_seconds = duration_ms // 1000
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        
-        if hours > 0:
-            return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        else:
-            return f"{minutes:02d}:{seconds:02d}"
+        """Format duration from milliseconds as MM:SS; minutes keep counting past an hour"""
+        minutes, seconds = divmod(duration_ms // 1000, 60)
+        return f"{minutes:02d}:{seconds:02d}"
 
 
 async def main():
@@ -246,4 +266,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    import asyncio
     asyncio.run(main())
\ No newline at end of file
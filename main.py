@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import asyncio
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict
 from pathlib import Path
@@ -15,9 +17,43 @@ from models import Playlist
 from config import SpotifyConfig
 
 
+# Anything other than letters, digits, spaces, '-' and '_' is dropped from export file names
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w \-]')
+
+_ALL_PLAYLISTS_NAME = "spotify_playlists"
+
+_BANNER_RULE = "=" * 50
+_MENU_RULE = "=" * 40
+_SUMMARY_RULE = "=" * 60
+
+
+def _unique_file_names(playlists: List[Playlist]) -> List[str]:
+    """
+    Safe base file name per playlist, unique within the batch. Individual files are
+    written concurrently, so two playlists must never share a path.
+    """
+    # Compare casefolded, since case-insensitive file systems treat "Mix" and "mix" as one file
+    used = {_ALL_PLAYLISTS_NAME.casefold()}
+    names = []
+    for playlist in playlists:
+        # Names made only of dropped characters (e.g. emoji) fall back to the playlist id
+        name = _UNSAFE_FILENAME_CHARS.sub('', playlist.name).rstrip() or playlist.id
+        if name.casefold() in used:
+            name = f"{name}_{playlist.id}"
+        base, counter = name, 2
+        while name.casefold() in used:
+            name = f"{base}_{counter}"
+            counter += 1
+        used.add(name.casefold())
+        names.append(name)
+    return names
+
+
 class PlaylistManager:
     """Main application for managing playlist backups and exports"""
     
+    MAX_EXPORT_WORKERS = 8
+    
     def __init__(self):
         self.music_service = None
         self.exporters: Dict[str, PlaylistExporter] = {
@@ -76,27 +112,39 @@ class PlaylistManager:
         
         exporter = self.exporters[format_type]
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Every file in this batch shares the same timestamp and extension
+        file_suffix = f"_{timestamp}.{exporter.file_extension}"
         
         # Export all playlists to one file
-        all_playlists_file = os.path.join(
-            output_dir, 
-            f"spotify_playlists_{timestamp}.{exporter.file_extension}"
-        )
+        all_playlists_file = os.path.join(output_dir, _ALL_PLAYLISTS_NAME + file_suffix)
         
         try:
-            exporter.export_playlists(self.selected_playlists, all_playlists_file)
+            # Streamed one playlist at a time, so the combined file is never built up in memory
+            exporter.stream_export(iter(self.selected_playlists), all_playlists_file)
             print(f"Exported {len(self.selected_playlists)} playlists to: {all_playlists_file}")
             
-            # Also export individual playlist files
-            for playlist in self.selected_playlists:
-                safe_name = "".join(c for c in playlist.name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-                individual_file = os.path.join(
-                    output_dir,
-                    f"{safe_name}_{timestamp}.{exporter.file_extension}"
-                )
-                
-                exporter.export_playlist(playlist, individual_file)
-                print(f"  - {playlist.name} → {individual_file}")
+            # Also export individual playlist files; each is an independent write, so overlap them
+            individual_files = [
+                os.path.join(output_dir, file_name + file_suffix)
+                for file_name in _unique_file_names(self.selected_playlists)
+            ]
+            
+            max_workers = min(self.MAX_EXPORT_WORKERS, len(self.selected_playlists))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(exporter.export_playlist, playlist, individual_file)
+                    for playlist, individual_file in zip(self.selected_playlists, individual_files)
+                ]
+                # Report in selection order with one write; result() re-raises any export
+                # failure, and files finished before it are still listed
+                lines = []
+                try:
+                    for playlist, individual_file, future in zip(self.selected_playlists, individual_files, futures):
+                        future.result()
+                        lines.append(f"  - {playlist.name} → {individual_file}")
+                finally:
+                    if lines:
+                        print("\n".join(lines))
                 
         except Exception as e:
             print(f"Export error: {e}")
@@ -107,41 +155,49 @@ class PlaylistManager:
             print("No playlists selected")
             return
         
-        total_tracks = sum(len(p.tracks) for p in self.selected_playlists)
-        total_duration_ms = sum(p.total_duration_ms for p in self.selected_playlists)
+        # Walk each playlist's tracks once and reuse the result for totals and per-playlist lines
+        track_counts = [len(p.tracks) for p in self.selected_playlists]
+        durations_ms = [p.total_duration_ms for p in self.selected_playlists]
+        total_tracks = sum(track_counts)
+        total_duration_ms = sum(durations_ms)
         
         # Convert duration to human readable format
         total_seconds = total_duration_ms // 1000
         hours = total_seconds // 3600
         minutes = (total_seconds % 3600) // 60
         
-        print(f"\n{'='*60}")
-        print("PLAYLIST BACKUP SUMMARY")
-        print(f"{'='*60}")
-        print(f"Total Playlists: {len(self.selected_playlists)}")
-        print(f"Total Tracks: {total_tracks:,}")
-        print(f"Total Duration: {hours:,}h {minutes:02d}m")
+        lines = [
+            f"\n{_SUMMARY_RULE}",
+            "PLAYLIST BACKUP SUMMARY",
+            _SUMMARY_RULE,
+            f"Total Playlists: {len(self.selected_playlists)}",
+            f"Total Tracks: {total_tracks:,}",
+            f"Total Duration: {hours:,}h {minutes:02d}m"
+        ]
         
         # Breakdown by type
         from collections import Counter
-        type_counts = Counter(p.playlist_type.value for p in self.selected_playlists)
-        print(f"\nBreakdown by Type:")
+        # Count enum members directly; .value is only needed once per distinct type
+        type_counts = Counter(p.playlist_type for p in self.selected_playlists)
+        lines.append(f"\nBreakdown by Type:")
         for playlist_type, count in type_counts.items():
-            print(f"  {playlist_type.title()}: {count}")
+            lines.append(f"  {playlist_type.value.title()}: {count}")
         
-        print(f"\nPlaylists:")
-        for i, playlist in enumerate(self.selected_playlists, 1):
-            tracks = len(playlist.tracks)
-            duration_mins = playlist.total_duration_ms // 60000
-            print(f"  {i:2d}. {playlist.name} ({tracks} tracks, {duration_mins}m)")
+        lines.append(f"\nPlaylists:")
+        for i, (playlist, tracks, duration_ms) in enumerate(
+            zip(self.selected_playlists, track_counts, durations_ms), 1
+        ):
+            duration_mins = duration_ms // 60000
+            lines.append(f"  {i:2d}. {playlist.name} ({tracks} tracks, {duration_mins}m)")
         
-        print(f"{'='*60}")
+        lines.append(_SUMMARY_RULE)
+        print("\n".join(lines))
 
 
 async def main():
     """Main application entry point"""
     print("🎵 Spotify Playlist Keeper")
-    print("=" * 50)
+    print(_BANNER_RULE)
     
     # Service type selection
     print("Select service type:")
@@ -161,45 +217,50 @@ async def main():
     
     manager = PlaylistManager()
     
-    # Initialize service
-    print(f"Initializing {service_type} service...")
-    if not await manager.initialize_service(service_type):
-        print("Failed to initialize service. Exiting.")
-        return
-    
-    # Main menu loop
-    while True:
-        print("\n" + "="*40)
-        print("MAIN MENU")
-        print("="*40)
-        print("1. Select playlists")
-        print("2. View current selection")
-        print("3. Export to JSON")
-        print("4. Export to CSV")
-        print("5. View summary")
-        print("0. Exit")
-        
-        choice = input("\nEnter your choice (0-5): ").strip()
-        
-        if choice == "0":
-            break
-        elif choice == "1":
-            await manager.select_playlists()
-        elif choice == "2":
-            if manager.selected_playlists:
-                print(f"\nSelected Playlists ({len(manager.selected_playlists)}):")
-                for i, playlist in enumerate(manager.selected_playlists, 1):
-                    print(f"  {i}. {playlist.name}")
+    # Close the service however the session ends, including Ctrl+C and errors
+    try:
+        # Initialize service
+        print(f"Initializing {service_type} service...")
+        if not await manager.initialize_service(service_type):
+            print("Failed to initialize service. Exiting.")
+            return
+        
+        # Main menu loop
+        while True:
+            print("\n" + _MENU_RULE)
+            print("MAIN MENU")
+            print(_MENU_RULE)
+            print("1. Select playlists")
+            print("2. View current selection")
+            print("3. Export to JSON")
+            print("4. Export to CSV")
+            print("5. View summary")
+            print("0. Exit")
+        
+            choice = input("\nEnter your choice (0-5): ").strip()
+        
+            if choice == "0":
+                break
+            elif choice == "1":
+                await manager.select_playlists()
+            elif choice == "2":
+                if manager.selected_playlists:
+                    print(f"\nSelected Playlists ({len(manager.selected_playlists)}):")
+                    for i, playlist in enumerate(manager.selected_playlists, 1):
+                        print(f"  {i}. {playlist.name}")
+                else:
+                    print("No playlists currently selected")
+            elif choice == "3":
+                manager.export_playlists("json")
+            elif choice == "4":
+                manager.export_playlists("csv")
+            elif choice == "5":
+                manager.display_summary()
             else:
-                print("No playlists currently selected")
-        elif choice == "3":
-            manager.export_playlists("json")
-        elif choice == "4":
-            manager.export_playlists("csv")
-        elif choice == "5":
-            manager.display_summary()
-        else:
-            print("Invalid choice. Please try again.")
+                print("Invalid choice. Please try again.")
+    finally:
+        if manager.music_service is not None:
+            await manager.music_service.close()
     
     print("\nThanks for using Spotify Playlist Keeper! 🎵")
 
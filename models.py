@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from enum import Enum
 
@@ -16,7 +16,7 @@ class TrackType(Enum):
     LOCAL = "local"
 
 
-@dataclass
+@dataclass(slots=True)
 class Artist:
     id: str
     name: str
@@ -24,7 +24,7 @@ class Artist:
     external_urls: Dict[str, str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Album:
     id: str
     name: str
@@ -36,7 +36,7 @@ class Album:
     external_urls: Dict[str, str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Track:
     id: str
     name: str
@@ -56,7 +56,7 @@ class Track:
     added_by_user_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaylistOwner:
     id: str
     display_name: str
@@ -64,7 +64,7 @@ class PlaylistOwner:
     external_urls: Dict[str, str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Playlist:
     id: str
     name: str
@@ -82,21 +82,32 @@ class Playlist:
     snapshot_id: str
     created_at: Optional[datetime] = None
     modified_at: Optional[datetime] = None
+    # Caches for total_duration_ms and unique_artists; slots leave no __dict__ for functools.cached_property
+    _total_duration_ms: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _unique_artists: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+
+    def set_tracks(self, tracks: List[Track]) -> None:
+        """Replace the track list, dropping totals computed from the old one"""
+        # The cached totals can't see edits made to the list itself; replace it through here instead
+        self.tracks = tracks
+        self._total_duration_ms = None
+        self._unique_artists = None
 
     @property
     def total_duration_ms(self) -> int:
-        return sum(track.duration_ms for track in self.tracks)
+        if self._total_duration_ms is None:
+            self._total_duration_ms = sum(track.duration_ms for track in self.tracks)
+        return self._total_duration_ms
     
     @property
-    def unique_artists(self) -> List[str]:
-        artists = set()
-        for track in self.tracks:
-            for artist in track.artists:
-                artists.add(artist.name)
-        return sorted(list(artists))
+    def unique_artists(self) -> Tuple[str, ...]:
+        # A tuple, so callers can't change the cached value
+        if self._unique_artists is None:
+            self._unique_artists = tuple(sorted({artist.name for track in self.tracks for artist in track.artists}))
+        return self._unique_artists
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     id: str
     display_name: str
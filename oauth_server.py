@@ -1,34 +1,16 @@
 import asyncio
+import hmac
+import time
 import urllib.parse
 import webbrowser
 from typing import Optional, Dict, Any
+import socket
 import threading
-import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
-import requests
+import aiohttp
 from config import SpotifyConfig, TokenManager
 
 
-class CallbackHandler(BaseHTTPRequestHandler):
-    """HTTP handler for OAuth2 callback"""
-    
-    def do_GET(self):
-        """Handle GET request to callback URL"""
-        # Parse the callback URL
-        parsed_url = urllib.parse.urlparse(self.path)
-        query_params = urllib.parse.parse_qs(parsed_url.query)
-        
-        # Store the authorization code or error
-        if 'code' in query_params:
-            self.server.auth_code = query_params['code'][0]
-            self.server.auth_state = query_params.get('state', [None])[0]
-            
-            # Send success response
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            
-            success_html = """
+_SUCCESS_HTML = """
             <!DOCTYPE html>
             <html>
             <head>
@@ -48,18 +30,8 @@ class CallbackHandler(BaseHTTPRequestHandler):
             </body>
             </html>
             """
-            
-            self.wfile.write(success_html.encode('utf-8'))
-            
-        elif 'error' in query_params:
-            self.server.auth_error = query_params['error'][0]
-            
-            # Send error response
-            self.send_response(400)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            
-            error_html = """
+
+_ERROR_HTML = """
             <!DOCTYPE html>
             <html>
             <head>
@@ -79,15 +51,34 @@ class CallbackHandler(BaseHTTPRequestHandler):
             </body>
             </html>
             """
-            
-            self.wfile.write(error_html.encode('utf-8'))
-        
-        # Signal that we've received a response
-        self.server.callback_received = True
-    
-    def log_message(self, format, *args):
-        """Suppress log messages"""
-        pass
+
+
+def _http_response(status: str, body: str = "") -> bytes:
+    """Build a complete HTTP/1.1 response that closes the connection"""
+    payload = body.encode('utf-8')
+    head = (
+        f"HTTP/1.1 {status}\r\n"
+        "Content-Type: text/html; charset=utf-8\r\n"
+        f"Content-Length: {len(payload)}\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    return head.encode('ascii') + payload
+
+
+# The callback only ever answers with one of these, so encode them once
+_SUCCESS_RESPONSE = _http_response("200 OK", _SUCCESS_HTML)
+_ERROR_RESPONSE = _http_response("400 Bad Request", _ERROR_HTML)
+_NOT_FOUND_RESPONSE = _http_response("404 Not Found")
+
+
+def _request_query(request: bytes) -> Dict[str, list]:
+    """Parse the query string out of a raw HTTP request's request line"""
+    request_line = request.split(b'\r\n', 1)[0]
+    parts = request_line.split(b' ')
+    if len(parts) < 2:
+        return {}
+    parsed_url = urllib.parse.urlparse(parts[1].decode('latin-1'))
+    return urllib.parse.parse_qs(parsed_url.query)
 
 
 class SpotifyOAuthServer:
@@ -95,45 +86,101 @@ class SpotifyOAuthServer:
     
     def __init__(self, config: SpotifyConfig):
         self.config = config
-        self.server: Optional[HTTPServer] = None
+        self.listener: Optional[socket.socket] = None
         self.server_thread: Optional[threading.Thread] = None
+        self.auth_code: Optional[str] = None
+        self.auth_error: Optional[str] = None
+        self.auth_state: Optional[str] = None
+        self.callback_event = threading.Event()
+        # Token exchange and refresh both hit accounts.spotify.com; keep that connection alive
+        # until SpotifyAuthenticator.close()
+        self._session: Optional[aiohttp.ClientSession] = None
         
     def start_server(self, port: int = 8000) -> None:
         """Start the callback server"""
         server_address = ('127.0.0.1', port)
-        self.server = HTTPServer(server_address, CallbackHandler)
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind(server_address)
+        self.listener.listen(1)
         
-        # Add attributes to store callback data
-        self.server.auth_code = None
-        self.server.auth_error = None
-        self.server.auth_state = None
-        self.server.callback_received = False
+        # Reset callback data
+        self.auth_code = None
+        self.auth_error = None
+        self.auth_state = None
+        self.callback_event = threading.Event()
         
-        # Start server in a separate thread
-        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        # Accept the callback in a separate thread
+        self.server_thread = threading.Thread(target=self._serve_callback, args=(self.listener,))
         self.server_thread.daemon = True
         self.server_thread.start()
         
         print(f"🔄 OAuth callback server started on {server_address[0]}:{server_address[1]}")
     
+    def _serve_callback(self, listener: socket.socket) -> None:
+        """Answer connections until the redirect carrying a code or error arrives"""
+        with listener:
+            while not self.callback_event.is_set():
+                try:
+                    conn, _ = listener.accept()
+                except OSError:
+                    # Listener was closed by stop_server
+                    return
+                
+                with conn:
+                    # Only the request line is needed, which always fits in the first read
+                    query_params = _request_query(conn.recv(4096))
+                    
+                    # Store the authorization code or error
+                    if 'code' in query_params:
+                        self.auth_code = query_params['code'][0]
+                        self.auth_state = query_params.get('state', [None])[0]
+                        conn.sendall(_SUCCESS_RESPONSE)
+                    elif 'error' in query_params:
+                        self.auth_error = query_params['error'][0]
+                        conn.sendall(_ERROR_RESPONSE)
+                    else:
+                        # e.g. the browser asking for /favicon.ico; keep waiting
+                        conn.sendall(_NOT_FOUND_RESPONSE)
+                        continue
+                
+                # Signal that we've received a response
+                self.callback_event.set()
+    
     def stop_server(self) -> None:
         """Stop the callback server"""
-        if self.server:
-            self.server.shutdown()
-            self.server.server_close()
+        if self.listener:
+            # shutdown() wakes a thread still blocked in accept(); close() alone may not
+            try:
+                self.listener.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.listener.close()
+            self.listener = None
         
         if self.server_thread and self.server_thread.is_alive():
             self.server_thread.join(timeout=1.0)
         
         print("⏹️  OAuth callback server stopped")
     
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the token-request session, creating it inside the running event loop"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+    
+    async def close(self) -> None:
+        """Close pooled HTTP connections used for token requests"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
     def get_authorization_url(self) -> str:
         """Generate the Spotify authorization URL"""
         import secrets
-        import base64
         
         # Generate state parameter for security
-        state = base64.urlsafe_b64encode(secrets.token_bytes(32)).decode('utf-8').rstrip('=')
+        state = secrets.token_urlsafe(32)
         
         auth_params = {
             'client_id': self.config.client_id,
@@ -151,28 +198,24 @@ class SpotifyOAuthServer:
     
     def wait_for_callback(self, timeout: int = 300) -> Optional[str]:
         """Wait for the OAuth callback and return authorization code"""
-        if not self.server:
+        if not self.server_thread:
             raise Exception("Server not started")
         
-        start_time = time.time()
-        
-        while not self.server.callback_received:
-            if time.time() - start_time > timeout:
-                raise TimeoutError("OAuth callback timeout")
-            
-            time.sleep(0.1)
+        # The callback thread sets the event, so no polling is needed
+        if not self.callback_event.wait(timeout):
+            raise TimeoutError("OAuth callback timeout")
         
         # Check for errors
-        if hasattr(self.server, 'auth_error') and self.server.auth_error:
-            raise Exception(f"OAuth error: {self.server.auth_error}")
+        if self.auth_error:
+            raise Exception(f"OAuth error: {self.auth_error}")
         
-        # Verify state parameter
-        if hasattr(self, 'expected_state') and self.server.auth_state != self.expected_state:
+        # Verify state parameter in constant time
+        if hasattr(self, 'expected_state') and not hmac.compare_digest(self.auth_state or '', self.expected_state):
             raise Exception("State parameter mismatch - possible CSRF attack")
         
-        return self.server.auth_code
+        return self.auth_code
     
-    def exchange_code_for_tokens(self, auth_code: str) -> Dict[str, Any]:
+    async def exchange_code_for_tokens(self, auth_code: str) -> Dict[str, Any]:
         """Exchange authorization code for access and refresh tokens"""
         token_url = 'https://accounts.spotify.com/api/token'
         
@@ -188,14 +231,13 @@ class SpotifyOAuthServer:
             'Content-Type': 'application/x-www-form-urlencoded'
         }
         
-        response = requests.post(token_url, data=token_data, headers=headers)
-        
-        if response.status_code != 200:
-            raise Exception(f"Token exchange failed: {response.text}")
-        
-        return response.json()
+        async with self._get_session().post(token_url, data=token_data, headers=headers) as response:
+            if response.status != 200:
+                raise Exception(f"Token exchange failed: {await response.text()}")
+            
+            return await response.json()
     
-    def refresh_access_token(self, refresh_token: str) -> Dict[str, Any]:
+    async def refresh_access_token(self, refresh_token: str) -> Dict[str, Any]:
         """Refresh access token using refresh token"""
         token_url = 'https://accounts.spotify.com/api/token'
         
@@ -210,21 +252,27 @@ class SpotifyOAuthServer:
             'Content-Type': 'application/x-www-form-urlencoded'
         }
         
-        response = requests.post(token_url, data=token_data, headers=headers)
-        
-        if response.status_code != 200:
-            raise Exception(f"Token refresh failed: {response.text}")
-        
-        return response.json()
+        async with self._get_session().post(token_url, data=token_data, headers=headers) as response:
+            if response.status != 200:
+                raise Exception(f"Token refresh failed: {await response.text()}")
+            
+            return await response.json()
 
 
 class SpotifyAuthenticator:
     """High-level Spotify authentication manager"""
     
+    # Refresh this long before expiry; matches the buffer TokenManager.is_token_valid uses
+    REFRESH_MARGIN_SECONDS = 300
+    # Wait this long before retrying a failed scheduled refresh
+    REFRESH_RETRY_SECONDS = 60
+    
     def __init__(self, config: SpotifyConfig, token_manager: TokenManager):
         self.config = config
         self.token_manager = token_manager
         self.oauth_server = SpotifyOAuthServer(config)
+        self._refresh_handle: Optional[asyncio.TimerHandle] = None
+        self._refresh_task: Optional[asyncio.Task] = None
     
     async def authenticate(self) -> bool:
         """Perform full OAuth2 authentication flow"""
@@ -232,6 +280,7 @@ class SpotifyAuthenticator:
             # Check if we have a valid token
             if self.token_manager.is_token_valid():
                 print("✅ Using existing valid access token")
+                self._schedule_refresh(self.token_manager.expires_at - time.time())
                 return True
             
             # Try to refresh if we have a refresh token
@@ -253,17 +302,18 @@ class SpotifyAuthenticator:
     async def _refresh_token(self) -> bool:
         """Refresh access token"""
         try:
-            token_response = self.oauth_server.refresh_access_token(
+            token_response = await self.oauth_server.refresh_access_token(
                 self.token_manager.refresh_token
             )
             
             # Save new tokens
-            self.token_manager.save_tokens(
+            await self.token_manager.save_tokens_async(
                 token_response['access_token'],
                 token_response.get('refresh_token', self.token_manager.refresh_token),
                 token_response['expires_in']
             )
             
+            self._schedule_refresh(token_response['expires_in'])
             print("✅ Access token refreshed successfully")
             return True
             
@@ -287,22 +337,24 @@ class SpotifyAuthenticator:
             
             # Wait for callback
             print("⏳ Waiting for authorization (this may take a few minutes)...")
-            auth_code = self.oauth_server.wait_for_callback()
+            # Block in a worker thread so the event loop keeps running while the user logs in
+            auth_code = await asyncio.to_thread(self.oauth_server.wait_for_callback)
             
             if not auth_code:
                 raise Exception("No authorization code received")
             
             # Exchange code for tokens
             print("🔄 Exchanging authorization code for tokens...")
-            token_response = self.oauth_server.exchange_code_for_tokens(auth_code)
+            token_response = await self.oauth_server.exchange_code_for_tokens(auth_code)
             
             # Save tokens
-            self.token_manager.save_tokens(
+            await self.token_manager.save_tokens_async(
                 token_response['access_token'],
                 token_response['refresh_token'],
                 token_response['expires_in']
             )
             
+            self._schedule_refresh(token_response['expires_in'])
             print("✅ Authentication successful!")
             return True
             
@@ -313,8 +365,64 @@ class SpotifyAuthenticator:
         finally:
             self.oauth_server.stop_server()
     
+    def _schedule_refresh(self, expires_in: float) -> None:
+        """Arrange for the access token to be refreshed shortly before it expires"""
+        self._schedule_refresh_in(max(0.0, expires_in - self.REFRESH_MARGIN_SECONDS))
+    
+    def _schedule_refresh_in(self, delay: float) -> None:
+        """Run the background refresh after delay seconds"""
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+        
+        self._refresh_handle = asyncio.get_running_loop().call_later(delay, self._start_scheduled_refresh)
+    
+    def _start_scheduled_refresh(self) -> None:
+        """Timer callback; keeps a reference so the refresh task isn't garbage collected"""
+        self._refresh_handle = None
+        self._refresh_task = asyncio.create_task(self._scheduled_refresh())
+    
+    async def _scheduled_refresh(self) -> None:
+        """Refresh the access token in the background"""
+        if not await self._refresh_token():
+            # Retry while the current token still works; after that ensure_access_token refreshes on demand
+            expires_at = self.token_manager.expires_at or 0
+            if expires_at - time.time() > self.REFRESH_RETRY_SECONDS:
+                self._schedule_refresh_in(self.REFRESH_RETRY_SECONDS)
+    
+    async def close(self) -> None:
+        """Cancel any pending refresh and close the token-request session"""
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+        
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+        self._refresh_task = None
+        
+        await self.oauth_server.close()
+    
     def get_access_token(self) -> Optional[str]:
-        """Get current valid access token"""
+        """Get current access token if it hasn't expired"""
         if self.token_manager.is_token_valid():
             return self.token_manager.access_token
-        return None
\ No newline at end of file
+        return None
+    
+    async def ensure_access_token(self) -> Optional[str]:
+        """Get current access token, refreshing it first if the scheduled refresh didn't run in time"""
+        access_token = self.get_access_token()
+        if access_token or not self.token_manager.has_refresh_token():
+            return access_token
+        
+        # Share one refresh between concurrent callers
+        if self._refresh_task is None or self._refresh_task.done():
+            if self._refresh_handle is not None:
+                self._refresh_handle.cancel()
+                self._refresh_handle = None
+            self._refresh_task = asyncio.create_task(self._scheduled_refresh())
+        await asyncio.shield(self._refresh_task)
+        
+        return self.get_access_token()
\ No newline at end of file
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from models import Playlist, UserProfile, Track
 
 
@@ -57,6 +57,10 @@ class MusicService(ABC):
     def is_authenticated(self) -> bool:
         """Check if the service is currently authenticated"""
         pass
+    
+    async def close(self) -> None:
+        """Release network resources held by the service"""
+        pass
 
 
 class PlaylistExporter(ABC):
@@ -72,6 +76,13 @@ class PlaylistExporter(ABC):
         """Export multiple playlists to a file"""
         pass
     
+    def stream_export(self, playlists: Iterable[Playlist], file_path: str) -> None:
+        """
+        Export playlists from an iterable (e.g. a generator of lazily fetched playlists).
+        Exporters that can write incrementally override this; the default collects them first.
+        """
+        self.export_playlists(list(playlists), file_path)
+    
     @property
     @abstractmethod
     def file_extension(self) -> str:
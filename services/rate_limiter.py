@@ -0,0 +1,42 @@
+import asyncio
+import time
+
+
+class RateLimiter:
+    """Token-bucket limiter shared by all coroutines issuing requests through one service"""
+    
+    def __init__(self, rate: float, burst: int):
+        """Allow `rate` requests per second on average, with up to `burst` back to back"""
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        # Waiters are served one at a time, in arrival order
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a request may be sent, then take one token"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                
+                # Refill for the time elapsed since the last update
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+    
+    def penalize(self, seconds: float) -> None:
+        """Hold all requests for `seconds`, e.g. after the server answers 429 with Retry-After"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        # Start refilling from an empty bucket once the pause ends
+        self._tokens = 0.0
+        self._updated = self._paused_until
@@ -1,8 +1,14 @@
 import asyncio
+import json
+import os
+import random
+import sys
 import aiohttp
-from typing import List, Optional, Dict, Any
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from datetime import datetime
+from pathlib import Path
 from services.base import MusicService, MusicServiceError, AuthenticationError, RateLimitError
+from services.rate_limiter import RateLimiter
 from models import (
     Playlist, UserProfile, Track, Artist, Album, PlaylistOwner,
     PlaylistType, TrackType
@@ -10,18 +16,98 @@ from models import (
 from config import SpotifyConfig, TokenManager
 from oauth_server import SpotifyAuthenticator
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+# Both accept the raw response bytes, so the body is never decoded to str first
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Spotify timestamps end in 'Z'; fromisoformat accepts that directly from Python 3.11
+if sys.version_info >= (3, 11):
+    _parse_iso = datetime.fromisoformat
+else:
+    def _parse_iso(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _user_cache_dir() -> Path:
+    """Per-user cache directory for this app, following each platform's convention"""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "playlist-manager"
+
 
 class SpotifyService(MusicService):
     """Real Spotify Web API service implementation"""
     
     BASE_URL = "https://api.spotify.com/v1"
+    # Response filters: only what the _parse_* methods read
+    PLAYLIST_FIELDS = "id,name,description,uri,owner(id,display_name,uri,external_urls),public,collaborative,followers(total),tracks(total),images,external_urls,snapshot_id"
+    TRACK_ITEM_FIELDS = "items(track(id,name,uri,duration_ms,explicit,popularity,track_number,disc_number,artists(id,name,uri,external_urls),album(id,name,uri,release_date,album_type,artists(id,name,uri,external_urls),images,external_urls),external_urls,external_ids),added_at,added_by(id)),next,total"
+    MAX_CONCURRENT_REQUESTS = 8
+    # Client-side pacing so concurrent fan-out stays under Spotify's rate limit
+    REQUESTS_PER_SECOND = 10
+    REQUEST_BURST = 20
+    # Retries after a 429 or 5xx response before the error is raised
+    MAX_RETRIES = 3
+    # Parse cached tracks in a worker thread from this many items up
+    THREAD_PARSE_MIN_ITEMS = 2000
     
-    def __init__(self):
+    def __init__(self, cache_file: Optional[str] = None):
         self.config = SpotifyConfig()
         self.token_manager = TokenManager()
         self.authenticator = SpotifyAuthenticator(self.config, self.token_manager)
         self._authenticated = False
         self._user_profile: Optional[UserProfile] = None
+        # Compared against every playlist's owner to classify it
+        self._user_id: Optional[str] = None
+        # Caps in-flight API calls when pages and playlists are fetched concurrently
+        self._request_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self.rate_limiter = RateLimiter(rate=self.REQUESTS_PER_SECOND, burst=self.REQUEST_BURST)
+        # Shared by every API call so connections to api.spotify.com are kept alive
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._auth_token: Optional[str] = None
+        self._auth_headers: Dict[str, str] = {}
+        # Parsed artists and albums by ID, so tracks that share them share one object
+        self._artist_cache: Dict[str, Artist] = {}
+        self._album_cache: Dict[str, Album] = {}
+        # Raw track items per playlist ID, valid while the playlist's snapshot_id is unchanged
+        self.cache_file = Path(cache_file) if cache_file else _user_cache_dir() / "spotify_playlist_cache.json"
+        self._track_cache: Optional[Dict[str, Dict[str, Any]]] = None
+    
+    async def __aenter__(self) -> "SpotifyService":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Return the shared API session, creating it inside the running event loop"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={"Content-Type": "application/json"},
+                # aiohttp speaks HTTP/1.1 only, so concurrency comes from pooled keep-alive
+                # connections: one per in-flight request, each reused across the whole sync
+                connector=aiohttp.TCPConnector(
+                    limit=self.MAX_CONCURRENT_REQUESTS,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                )
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """Close pooled HTTP connections"""
+        await self.authenticator.close()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     async def authenticate(self) -> bool:
         """Authenticate with Spotify using OAuth2"""
@@ -37,6 +123,7 @@ class SpotifyService(MusicService):
             # Load user profile after authentication
             try:
                 self._user_profile = await self.get_user_profile()
+                self._user_id = self._user_profile.id
             except Exception as e:
                 print(f"Warning: Could not load user profile: {e}")
         
@@ -66,39 +153,81 @@ class SpotifyService(MusicService):
         if not self._authenticated:
             raise AuthenticationError("Not authenticated")
         
-        playlists = []
-        offset = 0
         batch_limit = min(50, limit) if limit else 50  # Spotify max is 50
         
-        while True:
-            params = {
-                "limit": batch_limit,
-                "offset": offset
-            }
-            
-            data = await self._make_request("GET", "/me/playlists", params=params)
-            
-            batch_playlists = [self._parse_playlist_summary(item) for item in data["items"]]
-            playlists.extend(batch_playlists)
-            
-            # Check if we should stop
-            if not data.get("next") or (limit and len(playlists) >= limit):
-                break
+        # The first page reports the total, so the remaining pages can be requested together
+        data = await self._make_request("GET", "/me/playlists", params={"limit": batch_limit, "offset": 0})
+        items = list(data["items"])
+        
+        if data.get("next"):
+            total = data.get("total", 0)
+            if limit:
+                total = min(total, limit)
             
-            offset += batch_limit
+            pages = await asyncio.gather(*(
+                self._make_request("GET", "/me/playlists", params={"limit": batch_limit, "offset": offset})
+                for offset in range(batch_limit, total, batch_limit)
+            ))
+            for page in pages:
+                items.extend(page["items"])
+        
+        playlists = [self._parse_playlist_summary(item) for item in items]
         
         # Limit results if requested
         if limit:
             playlists = playlists[:limit]
         
-        # Load detailed track information for each playlist
-        for playlist in playlists:
-            try:
-                detailed_playlist = await self.get_playlist_details(playlist.id)
-                playlist.tracks = detailed_playlist.tracks
-            except Exception as e:
-                print(f"Warning: Could not load tracks for playlist {playlist.name}: {e}")
-                playlist.tracks = []
+        # Playlists whose snapshot_id matches the cache haven't changed since they were
+        # last fetched; only the rest need their tracks downloaded
+        track_cache = await self._get_track_cache()
+        to_fetch = [
+            playlist for playlist in playlists
+            if track_cache.get(playlist.id, {}).get("snapshot_id") != playlist.snapshot_id
+        ]
+        
+        # Load tracks for every changed playlist concurrently; the request
+        # semaphore bounds how many are in flight
+        results = await asyncio.gather(
+            *(self._load_tracks(playlist.id) for playlist in to_fetch),
+            return_exceptions=True
+        )
+        fetched = {}
+        for playlist, result in zip(to_fetch, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, Exception):
+                print(f"Warning: Could not load tracks for playlist {playlist.name}: {result}")
+                playlist.set_tracks([])
+            else:
+                items, tracks = result
+                playlist.set_tracks(tracks)
+                fetched[playlist.id] = {"snapshot_id": playlist.snapshot_id, "items": items}
+        
+        # Forget playlists that have left the library; a limited listing doesn't show the whole library
+        library_ids = {playlist.id for playlist in playlists}
+        stale_ids = [] if limit else [playlist_id for playlist_id in track_cache if playlist_id not in library_ids]
+        for playlist_id in stale_ids:
+            del track_cache[playlist_id]
+        
+        if fetched or stale_ids:
+            track_cache.update(fetched)
+            await asyncio.to_thread(self._save_track_cache)
+        
+        fetch_ids = {playlist.id for playlist in to_fetch}
+        cached = [playlist for playlist in playlists if playlist.id not in fetch_ids]
+        cached_items = sum(len(track_cache[playlist.id]["items"]) for playlist in cached)
+        # Rebuilding a large library from the cache is pure CPU work; keep it off the event loop.
+        # The worker fills its own artist and album dicts, merged back here, since coroutines
+        # on the loop may be using the service-wide ones meanwhile.
+        if cached_items >= self.THREAD_PARSE_MIN_ITEMS:
+            artist_cache, album_cache = dict(self._artist_cache), dict(self._album_cache)
+            await asyncio.to_thread(self._parse_cached_tracks, cached, track_cache, artist_cache, album_cache)
+            for artist_id, artist in artist_cache.items():
+                self._artist_cache.setdefault(artist_id, artist)
+            for album_id, album in album_cache.items():
+                self._album_cache.setdefault(album_id, album)
+        else:
+            self._parse_cached_tracks(cached, track_cache, self._artist_cache, self._album_cache)
         
         return playlists
     
@@ -107,11 +236,11 @@ class SpotifyService(MusicService):
         if not self._authenticated:
             raise AuthenticationError("Not authenticated")
         
-        # Get playlist metadata
-        playlist_data = await self._make_request("GET", f"/playlists/{playlist_id}")
-        
-        # Get all tracks for the playlist
-        tracks = await self.get_playlist_tracks(playlist_id)
+        # Metadata and tracks are independent requests, so fetch them together
+        playlist_data, tracks = await asyncio.gather(
+            self._make_request("GET", f"/playlists/{playlist_id}", params={"fields": self.PLAYLIST_FIELDS}),
+            self.get_playlist_tracks(playlist_id)
+        )
         
         return self._parse_playlist_detailed(playlist_data, tracks)
     
@@ -120,31 +249,147 @@ class SpotifyService(MusicService):
         if not self._authenticated:
             raise AuthenticationError("Not authenticated")
         
-        tracks = []
-        offset = 0
+        _, tracks = await self._load_tracks(playlist_id)
+        return tracks
+    
+    async def _load_tracks(self, playlist_id: str) -> Tuple[List[Dict[str, Any]], List[Track]]:
+        """Fetch a playlist's raw track items and parse them, one page at a time as pages arrive"""
+        items: List[Dict[str, Any]] = []
+        tracks: List[Track] = []
+        async for page_items in self._iter_track_pages(playlist_id):
+            items.extend(page_items)
+            tracks.extend(self._parse_track_items(page_items, self._artist_cache, self._album_cache))
+        return items, tracks
+    
+    async def _iter_track_pages(self, playlist_id: str) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield the raw track items of each page in order.
+        After the first page every remaining page is requested at once, so the caller
+        parses each page while later ones are still in flight.
+        """
         limit = 50  # Spotify max
+        params = {
+            "limit": limit,
+            "offset": 0,
+            "fields": self.TRACK_ITEM_FIELDS
+        }
+        endpoint = f"/playlists/{playlist_id}/tracks"
         
-        while True:
-            params = {
-                "limit": limit,
-                "offset": offset,
-                "fields": "items(track(id,name,uri,duration_ms,explicit,popularity,track_number,disc_number,artists(id,name,uri,external_urls),album(id,name,uri,release_date,album_type,artists(id,name,uri,external_urls),images,external_urls),external_urls,external_ids),added_at,added_by(id)),next"
-            }
-            
-            data = await self._make_request("GET", f"/playlists/{playlist_id}/tracks", params=params)
-            
-            for item in data["items"]:
-                if item["track"] and item["track"]["id"]:  # Skip null tracks and local files
-                    track = self._parse_track(item["track"], item.get("added_at"), item.get("added_by"))
-                    tracks.append(track)
-            
-            if not data.get("next"):
-                break
-            
-            offset += limit
+        data = await self._make_request("GET", endpoint, params=params)
+        if data.get("next") and data.get("total") is None:
+            # No total to fan out from; still overlap each page's parse with the next request
+            async for page_items in self._iter_track_pages_prefetching(endpoint, params, data):
+                yield page_items
+            return
+        
+        # The first page reports the total, so the remaining pages can be requested together
+        pending = []
+        if data.get("next"):
+            pending = [
+                asyncio.create_task(self._make_request("GET", endpoint, params={**params, "offset": offset}))
+                for offset in range(limit, data["total"], limit)
+            ]
+        
+        try:
+            yield data["items"]
+            for task in pending:
+                yield (await task)["items"]
+        finally:
+            # Stop outstanding requests if the caller stops early or a page fails,
+            # and collect their outcomes so no task exception goes unretrieved
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+    
+    async def _iter_track_pages_prefetching(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        data: Dict[str, Any]
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Follow pages one by one, requesting page n+1 before handing page n to the caller"""
+        offset = params["offset"]
+        next_task: Optional[asyncio.Task] = None
+        try:
+            while data.get("next"):
+                offset += params["limit"]
+                next_task = asyncio.create_task(
+                    self._make_request("GET", endpoint, params={**params, "offset": offset})
+                )
+                yield data["items"]
+                data = await next_task
+                next_task = None
+            yield data["items"]
+        finally:
+            if next_task is not None:
+                next_task.cancel()
+                await asyncio.gather(next_task, return_exceptions=True)
+    
+    def _parse_cached_tracks(
+        self,
+        playlists: List[Playlist],
+        track_cache: Dict[str, Dict[str, Any]],
+        artist_cache: Dict[str, Artist],
+        album_cache: Dict[str, Album]
+    ) -> None:
+        """Fill in each playlist's tracks from its cached track items"""
+        for playlist in playlists:
+            playlist.set_tracks(self._parse_track_items(track_cache[playlist.id]["items"], artist_cache, album_cache))
+    
+    def _parse_track_items(
+        self,
+        items: List[Dict[str, Any]],
+        artist_cache: Dict[str, Artist],
+        album_cache: Dict[str, Album]
+    ) -> List[Track]:
+        """Parse raw track items, skipping null tracks and local files"""
+        tracks = []
+        for item in items:
+            if item["track"] and item["track"]["id"]:
+                track = self._parse_track(
+                    item["track"], artist_cache, album_cache, item.get("added_at"), item.get("added_by")
+                )
+                tracks.append(track)
         
         return tracks
     
+    async def _get_track_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Return the on-disk track cache, reading it on first use"""
+        if self._track_cache is None:
+            self._track_cache = await asyncio.to_thread(self._load_track_cache)
+        return self._track_cache
+    
+    def _load_track_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Read cached track items from file; a missing or unreadable cache is empty"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"Warning: Could not load playlist cache: {e}")
+            return {}
+        
+        if not isinstance(data, dict):
+            print("Warning: Ignoring malformed playlist cache")
+            return {}
+        # Skip malformed entries; those playlists are simply fetched again
+        return {
+            playlist_id: entry for playlist_id, entry in data.items()
+            if isinstance(entry, dict)
+            and isinstance(entry.get("snapshot_id"), str)
+            and isinstance(entry.get("items"), list)
+        }
+    
+    def _save_track_cache(self) -> None:
+        """Write cached track items to file"""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self._track_cache, f, ensure_ascii=False)
+        except OSError as e:
+            print(f"Warning: Could not save playlist cache: {e}")
+    
     @property
     def service_name(self) -> str:
         return "Spotify"
@@ -155,56 +400,64 @@ class SpotifyService(MusicService):
     
     async def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None, json_data: Optional[Dict] = None) -> Dict[str, Any]:
         """Make authenticated request to Spotify API"""
-        access_token = self.authenticator.get_access_token()
+        access_token = await self.authenticator.ensure_access_token()
         if not access_token:
             raise AuthenticationError("No valid access token")
         
         url = f"{self.BASE_URL}{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
+        # Content-Type is a session default; rebuild the auth header only when the token rotates
+        if access_token != self._auth_token:
+            self._auth_headers = {"Authorization": f"Bearer {access_token}"}
+            self._auth_token = access_token
+        headers = self._auth_headers
         
-        async with aiohttp.ClientSession() as session:
-            async with session.request(method, url, params=params, json=json_data, headers=headers) as response:
+        async with self._request_semaphore:
+            session = await self._ensure_session()
+            for attempt in range(self.MAX_RETRIES + 1):
+                await self.rate_limiter.acquire()
+                async with session.request(method, url, params=params, json=json_data, headers=headers) as response:
+                    
+                    if response.status == 429:  # Rate limited
+                        retry_after = int(response.headers.get("Retry-After", 60))
+                        # Hold every other request too; the next acquire() waits out the pause
+                        self.rate_limiter.penalize(retry_after)
+                        if attempt < self.MAX_RETRIES:
+                            continue
+                        raise RateLimitError(f"Rate limited. Retry after {retry_after} seconds")
+                    
+                    if response.status == 401:  # Unauthorized
+                        raise AuthenticationError("Access token expired or invalid")
+                    
+                    if response.status >= 500 and attempt < self.MAX_RETRIES:
+                        # Transient server error; back off exponentially with jitter
+                        backoff = 2 ** attempt + random.random()
+                    elif response.status >= 400:
+                        error_text = await response.text()
+                        raise MusicServiceError(f"API error {response.status}: {error_text}")
+                    else:
+                        return _json_loads(await response.read())
                 
-                if response.status == 429:  # Rate limited
-                    retry_after = int(response.headers.get("Retry-After", 60))
-                    raise RateLimitError(f"Rate limited. Retry after {retry_after} seconds")
-                
-                if response.status == 401:  # Unauthorized
-                    raise AuthenticationError("Access token expired or invalid")
-                
-                if response.status >= 400:
-                    error_text = await response.text()
-                    raise MusicServiceError(f"API error {response.status}: {error_text}")
-                
-                return await response.json()
+                await asyncio.sleep(backoff)
     
     def _parse_playlist_summary(self, data: Dict[str, Any]) -> Playlist:
         """Parse playlist summary data from API response"""
+        owner_data = data["owner"]
         owner = PlaylistOwner(
-            id=data["owner"]["id"],
-            display_name=data["owner"]["display_name"],
-            uri=data["owner"]["uri"],
-            external_urls=data["owner"].get("external_urls", {})
+            id=owner_data["id"],
+            display_name=owner_data["display_name"],
+            uri=owner_data["uri"],
+            external_urls=owner_data.get("external_urls", {})
         )
-        
-        # Determine playlist type
-        current_user_id = self._user_profile.id if self._user_profile else None
-        if data["owner"]["id"] == current_user_id:
-            playlist_type = PlaylistType.COLLABORATIVE if data.get("collaborative", False) else PlaylistType.OWNED
-        else:
-            playlist_type = PlaylistType.FOLLOWED
+        collaborative = data.get("collaborative", False)
         
         return Playlist(
             id=data["id"],
             name=data["name"],
             description=data.get("description"),
             uri=data["uri"],
-            playlist_type=playlist_type,
+            playlist_type=self._classify_playlist(owner.id, self._user_id, collaborative),
             public=data.get("public", False),
-            collaborative=data.get("collaborative", False),
+            collaborative=collaborative,
             owner=owner,
             follower_count=data.get("followers", {}).get("total", 0),
             track_count=data["tracks"]["total"],
@@ -214,53 +467,77 @@ class SpotifyService(MusicService):
             snapshot_id=data["snapshot_id"]
         )
     
+    @staticmethod
+    def _classify_playlist(owner_id: str, user_id: Optional[str], collaborative: bool) -> PlaylistType:
+        """Determine playlist type from its owner and the current user"""
+        if owner_id != user_id:
+            return PlaylistType.FOLLOWED
+        return PlaylistType.COLLABORATIVE if collaborative else PlaylistType.OWNED
+    
     def _parse_playlist_detailed(self, data: Dict[str, Any], tracks: List[Track]) -> Playlist:
         """Parse detailed playlist data from API response"""
         playlist = self._parse_playlist_summary(data)
-        playlist.tracks = tracks
+        playlist.set_tracks(tracks)
         return playlist
     
-    def _parse_track(self, data: Dict[str, Any], added_at_str: Optional[str] = None, added_by: Optional[Dict] = None) -> Track:
-        """Parse track data from API response"""
-        # Parse artists
-        artists = [
-            Artist(
-                id=artist["id"],
-                name=artist["name"],
-                uri=artist["uri"],
-                external_urls=artist.get("external_urls", {})
+    def _parse_artist(self, data: Dict[str, Any], artist_cache: Dict[str, Artist]) -> Artist:
+        """Parse artist data, reusing the Artist already parsed for the same ID"""
+        artist = artist_cache.get(data["id"])
+        if artist is None:
+            artist = artist_cache[data["id"]] = Artist(
+                id=data["id"],
+                name=data["name"],
+                uri=data["uri"],
+                external_urls=data.get("external_urls", {})
             )
-            for artist in data.get("artists", [])
-        ]
-        
-        # Parse album
-        album_data = data.get("album", {})
-        album_artists = [
-            Artist(
-                id=artist["id"],
-                name=artist["name"], 
-                uri=artist["uri"],
-                external_urls=artist.get("external_urls", {})
+        return artist
+    
+    def _parse_album(
+        self,
+        album_data: Dict[str, Any],
+        artist_cache: Dict[str, Artist],
+        album_cache: Dict[str, Album]
+    ) -> Album:
+        """Parse album data, reusing the Album already parsed for the same ID"""
+        album_id = album_data.get("id", "")
+        album = album_cache.get(album_id) if album_id else None
+        if album is None:
+            album_type = album_data.get("album_type", "album")
+            album = Album(
+                id=album_id,
+                name=album_data.get("name", ""),
+                uri=album_data.get("uri", ""),
+                release_date=album_data.get("release_date", ""),
+                # Few distinct values across a library; intern them, leaving None as it came
+                album_type=sys.intern(album_type) if isinstance(album_type, str) else album_type,
+                artists=[self._parse_artist(artist, artist_cache) for artist in album_data.get("artists", [])],
+                images=album_data.get("images", []),
+                external_urls=album_data.get("external_urls", {})
             )
-            for artist in album_data.get("artists", [])
-        ]
+            if album_id:
+                album_cache[album_id] = album
+        return album
+    
+    def _parse_track(
+        self,
+        data: Dict[str, Any],
+        artist_cache: Dict[str, Artist],
+        album_cache: Dict[str, Album],
+        added_at_str: Optional[str] = None,
+        added_by: Optional[Dict] = None
+    ) -> Track:
+        """Parse track data from API response; artists and albums are shared through the given caches"""
+        # Parse artists
+        artists = [self._parse_artist(artist, artist_cache) for artist in data.get("artists", [])]
         
-        album = Album(
-            id=album_data.get("id", ""),
-            name=album_data.get("name", ""),
-            uri=album_data.get("uri", ""),
-            release_date=album_data.get("release_date", ""),
-            album_type=album_data.get("album_type", "album"),
-            artists=album_artists,
-            images=album_data.get("images", []),
-            external_urls=album_data.get("external_urls", {})
-        )
+        # Parse album
+        album = self._parse_album(data.get("album", {}), artist_cache, album_cache)
         
         # Parse added_at timestamp
         added_at = None
         if added_at_str:
             try:
-                added_at = datetime.fromisoformat(added_at_str.replace('Z', '+00:00'))
+                added_at = _parse_iso(added_at_str)
             except (ValueError, AttributeError):
                 pass
         
@@ -285,5 +562,5 @@ class SpotifyService(MusicService):
             external_urls=data.get("external_urls", {}),
             isrc=isrc,
             added_at=added_at,
-            added_by_user_id=added_by.get("id") if added_by else None
+            added_by_user_id=sys.intern(added_by["id"]) if added_by and added_by.get("id") else None
         )
\ No newline at end of file
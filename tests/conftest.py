@@ -0,0 +1,90 @@
+import pytest
+from interface import PlaylistSelector
+from exporters.json_exporter import JSONExporter
+from exporters.csv_exporter import CSVExporter
+from services.mock_spotify import MockSpotifyService
+from models import Artist, Album, PlaylistOwner
+
+
+@pytest.fixture(scope="session")
+async def mock_service():
+    """Authenticated MockSpotifyService shared by the whole test session"""
+    service = MockSpotifyService()
+    await service.authenticate()
+    return service
+
+
+@pytest.fixture(scope="session")
+async def playlists(mock_service):
+    """Playlists from the shared mock service, fetched once per session"""
+    return await mock_service.get_user_playlists()
+
+
+@pytest.fixture(scope="session")
+async def user_profile(mock_service):
+    """User profile from the shared mock service, fetched once per session"""
+    return await mock_service.get_user_profile()
+
+
+@pytest.fixture(scope="session")
+async def full_interface(mock_service):
+    """Selector with all playlists loaded, built once per session"""
+    selector = PlaylistSelector(mock_service)
+    await selector.load_playlists()
+    return selector
+
+
+@pytest.fixture(scope="session")
+def sample_playlists(full_interface):
+    """Playlists loaded through the shared selector"""
+    return full_interface.playlists
+
+
+@pytest.fixture(scope="session")
+def exported_two_playlists(sample_playlists, tmp_path_factory):
+    """JSON and CSV exports of the first two playlists, written once and shared as text"""
+    playlists = sample_playlists[:2]
+    out_dir = tmp_path_factory.mktemp("exports")
+    exports = {}
+    for export_format, exporter in (("json", JSONExporter()), ("csv", CSVExporter())):
+        out_file = out_dir / f"two_playlists.{exporter.file_extension}"
+        exporter.export_playlists(playlists, str(out_file))
+        exports[export_format] = out_file.read_text(encoding="utf-8")
+    return exports
+
+
+@pytest.fixture(scope="session")
+def sample_artist():
+    """Artist for model tests; tests only read it"""
+    return Artist(
+        id="artist123",
+        name="Test Artist",
+        uri="spotify:artist:artist123",
+        external_urls={"spotify": "https://spotify.com/artist/artist123"}
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_album(sample_artist):
+    """Album by the sample artist"""
+    return Album(
+        id="album123",
+        name="Test Album",
+        uri="spotify:album:album123",
+        release_date="2023-01-01",
+        album_type="album",
+        artists=[sample_artist],
+        images=[],
+        external_urls={"spotify": "https://spotify.com/album/album123"}
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_owner():
+    """Playlist owner for model tests"""
+    return PlaylistOwner(
+        id="user123",
+        display_name="Test User",
+        uri="spotify:user:user123",
+        external_urls={"spotify": "https://spotify.com/user/user123"}
+    )
@@ -0,0 +1,36 @@
+import os
+import pytest
+from config import load_env_file, _ENV_LINE
+
+
+class TestLoadEnvFile:
+    """Test suite for .env parsing"""
+    
+    @pytest.mark.parametrize("newline", [b"\n", b"\r\n"], ids=["lf", "crlf"])
+    def test_quoted_values(self, tmp_path, monkeypatch, newline):
+        """Test quotes are stripped and no line ending leaks into values"""
+        env_file = tmp_path / ".env"
+        env_file.write_bytes(newline.join([
+            b"# Spotify API Credentials",
+            b'SPOTIFY_CLIENT_ID="abc"',
+            b"SPOTIFY_CLIENT_SECRET='secret'  ",
+            b"SPOTIFY_REDIRECT_URI=http://127.0.0.1:8000/callback",
+            b"",
+        ]))
+        for key in ("SPOTIFY_CLIENT_ID", "SPOTIFY_CLIENT_SECRET", "SPOTIFY_REDIRECT_URI"):
+            monkeypatch.delenv(key, raising=False)
+        
+        load_env_file(str(env_file))
+        
+        assert os.environ["SPOTIFY_CLIENT_ID"] == "abc"
+        assert os.environ["SPOTIFY_CLIENT_SECRET"] == "secret"
+        assert os.environ["SPOTIFY_REDIRECT_URI"] == "http://127.0.0.1:8000/callback"
+    
+    def test_env_line_trims_carriage_return(self):
+        """Test the line pattern keeps CRLF endings out of keys and values"""
+        text = 'SPOTIFY_CLIENT_ID="abc"\r\nSPOTIFY_CLIENT_SECRET = secret \r\n'
+        
+        assert _ENV_LINE.findall(text) == [
+            ("SPOTIFY_CLIENT_ID", '"abc"'),
+            ("SPOTIFY_CLIENT_SECRET", "secret"),
+        ]
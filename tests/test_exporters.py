@@ -1,97 +1,73 @@
 import pytest
-import json
 import csv
-import tempfile
-import os
+from io import StringIO
 from datetime import datetime
 from exporters.json_exporter import JSONExporter
 from exporters.csv_exporter import CSVExporter
-from services.mock_spotify import MockSpotifyService
-from interface import PlaylistInterface
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    from json import loads as json_loads
+
+
+def _parse_csv(csv_string):
+    """Parse a CSV export into one dict per track row"""
+    return list(csv.DictReader(StringIO(csv_string)))
 
 
 class TestJSONExporter:
     """Test suite for JSONExporter"""
     
-    @pytest.fixture
-    async def sample_playlists(self):
-        """Create sample playlists for testing"""
-        service = MockSpotifyService()
-        await service.initialize()
-        interface = PlaylistInterface(service)
-        await interface.load_playlists()
-        return interface.playlists
-    
     def test_json_exporter_creation(self):
         """Test JSONExporter initialization"""
         exporter = JSONExporter()
         assert exporter is not None
         
-    @pytest.mark.asyncio
-    async def test_export_to_string(self, sample_playlists):
-        """Test exporting playlists to JSON string"""
-        exporter = JSONExporter()
-        selected_playlists = sample_playlists[:2]  # First two playlists
-        
-        json_string = await exporter.export_to_string(selected_playlists)
-        
-        assert json_string is not None
-        assert len(json_string) > 0
-        
-        # Parse JSON to verify structure
-        data = json.loads(json_string)
-        assert "export_metadata" in data
-        assert "playlists" in data
-        assert len(data["playlists"]) == 2
-        
-        # Check metadata
-        metadata = data["export_metadata"]
-        assert "export_date" in metadata
-        assert "total_playlists" in metadata
-        assert "total_tracks" in metadata
-        assert metadata["total_playlists"] == 2
-        assert metadata["total_tracks"] == 5  # 3 + 2
-        
-    @pytest.mark.asyncio
-    async def test_export_to_file(self, sample_playlists):
+    def test_export_to_file(self, sample_playlists, tmp_path):
         """Test exporting playlists to JSON file"""
         exporter = JSONExporter()
         selected_playlists = sample_playlists[:1]  # First playlist
+        out_file = tmp_path / "out.json"
         
-        with tempfile.NamedTemporaryFile(mode='w+', suffix='.json', delete=False) as tmp_file:
-            try:
-                await exporter.export_to_file(selected_playlists, tmp_file.name)
-                
-                # Verify file was created and contains valid JSON
-                assert os.path.exists(tmp_file.name)
-                
-                with open(tmp_file.name, 'r') as f:
-                    data = json.load(f)
-                    
-                assert "export_metadata" in data
-                assert "playlists" in data
-                assert len(data["playlists"]) == 1
-                assert data["playlists"][0]["name"] == "My Favorite Songs"
-                
-            finally:
-                # Clean up
-                if os.path.exists(tmp_file.name):
-                    os.unlink(tmp_file.name)
+        exporter.export_playlists(selected_playlists, str(out_file))
+        
+        # Opening the file checks it was created; parsing checks it is valid JSON
+        with open(out_file, 'rb') as f:
+            data = json_loads(f.read())
+            
+        assert data["total_playlists"] == 1
+        assert "playlists" in data
+        assert len(data["playlists"]) == 1
+        assert data["playlists"][0]["name"] == "My Favorite Songs"
+    
+    @pytest.mark.parametrize("method", ["export_playlists", "stream_export"])
+    def test_export_playlists_writes_bytes(self, sample_playlists, tmp_path, method):
+        """Test the byte-writing multi-playlist export parses back to the same playlists"""
+        selected_playlists = sample_playlists[:2]
+        out_file = tmp_path / "out.json"
+        
+        getattr(JSONExporter(), method)(selected_playlists, str(out_file))
+        data = json_loads(out_file.read_bytes())
+        
+        assert data["total_playlists"] == 2
+        assert [p["name"] for p in data["playlists"]] == [p.name for p in selected_playlists]
+        assert [len(p["tracks"]) for p in data["playlists"]] == [p.track_count for p in selected_playlists]
                     
-    @pytest.mark.asyncio
-    async def test_json_playlist_structure(self, sample_playlists):
+    def test_json_playlist_structure(self, sample_playlists, tmp_path):
         """Test JSON playlist structure is complete"""
         exporter = JSONExporter()
         playlist = sample_playlists[0]  # My Favorite Songs
+        out_file = tmp_path / "out.json"
         
-        json_string = await exporter.export_to_string([playlist])
-        data = json.loads(json_string)
+        exporter.export_playlists([playlist], str(out_file))
+        data = json_loads(out_file.read_bytes())
         
         playlist_data = data["playlists"][0]
         
         # Check required fields
         required_fields = [
-            "id", "name", "description", "uri", "playlist_type", "public",
+            "id", "name", "description", "uri", "type", "public",
             "collaborative", "owner", "follower_count", "track_count",
             "tracks", "total_duration_ms", "unique_artists", "created_at"
         ]
@@ -110,203 +86,164 @@ class TestJSONExporter:
         
         for field in track_fields:
             assert field in track, f"Missing track field: {field}"
-            
-    @pytest.mark.asyncio
-    async def test_json_export_empty_playlist_list(self):
-        """Test exporting empty playlist list"""
-        exporter = JSONExporter()
-        
-        json_string = await exporter.export_to_string([])
-        data = json.loads(json_string)
-        
-        assert data["export_metadata"]["total_playlists"] == 0
-        assert data["export_metadata"]["total_tracks"] == 0
-        assert len(data["playlists"]) == 0
 
 
 class TestCSVExporter:
     """Test suite for CSVExporter"""
     
-    @pytest.fixture
-    async def sample_playlists(self):
-        """Create sample playlists for testing"""
-        service = MockSpotifyService()
-        await service.initialize()
-        interface = PlaylistInterface(service)
-        await interface.load_playlists()
-        return interface.playlists
-    
     def test_csv_exporter_creation(self):
         """Test CSVExporter initialization"""
         exporter = CSVExporter()
         assert exporter is not None
         
-    @pytest.mark.asyncio
-    async def test_export_to_string(self, sample_playlists):
-        """Test exporting playlists to CSV string"""
+    def test_export_to_file(self, sample_playlists, tmp_path):
+        """Test exporting playlists to CSV file"""
         exporter = CSVExporter()
-        selected_playlists = sample_playlists[:2]  # First two playlists
-        
-        csv_string = await exporter.export_to_string(selected_playlists)
-        
-        assert csv_string is not None
-        assert len(csv_string) > 0
-        
-        # Check CSV structure
-        lines = csv_string.strip().split('\n')
-        assert len(lines) >= 6  # Header + 5 tracks (3 + 2)
+        selected_playlists = sample_playlists[:1]  # First playlist
+        out_file = tmp_path / "out.csv"
         
-        # Check header
-        header = lines[0]
-        expected_columns = [
-            "playlist_name", "playlist_id", "playlist_type", "track_name",
-            "track_id", "artist_name", "album_name", "duration_ms", "track_number"
-        ]
+        exporter.export_playlists(selected_playlists, str(out_file))
         
-        for column in expected_columns:
-            assert column in header
+        # Opening the file checks it was created
+        with open(out_file, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            rows = list(reader)
             
-    @pytest.mark.asyncio
-    async def test_export_to_file(self, sample_playlists):
-        """Test exporting playlists to CSV file"""
-        exporter = CSVExporter()
-        selected_playlists = sample_playlists[:1]  # First playlist
+        # Should have header + 3 tracks
+        assert len(rows) == 4
         
-        with tempfile.NamedTemporaryFile(mode='w+', suffix='.csv', delete=False) as tmp_file:
-            try:
-                await exporter.export_to_file(selected_playlists, tmp_file.name)
-                
-                # Verify file was created
-                assert os.path.exists(tmp_file.name)
-                
-                with open(tmp_file.name, 'r') as f:
-                    reader = csv.reader(f)
-                    rows = list(reader)
-                    
-                # Should have header + 3 tracks
-                assert len(rows) == 4
-                
-                # Check header row
-                header = rows[0]
-                assert "playlist_name" in header
-                assert "track_name" in header
-                assert "artist_name" in header
-                
-                # Check first data row
-                first_row = rows[1]
-                assert first_row[0] == "My Favorite Songs"  # playlist_name
-                assert "Bohemian Rhapsody" in first_row  # track_name should be somewhere
-                
-            finally:
-                # Clean up
-                if os.path.exists(tmp_file.name):
-                    os.unlink(tmp_file.name)
+        # Check header row
+        header = rows[0]
+        assert "playlist_name" in header
+        assert "track_name" in header
+        assert "artist_names" in header
+        
+        # Check first data row
+        first_row = dict(zip(header, rows[1]))
+        assert first_row["playlist_name"] == "My Favorite Songs"
+        assert first_row["track_name"] == "cardigan"
                     
-    @pytest.mark.asyncio
-    async def test_csv_track_data_accuracy(self, sample_playlists):
+    def test_csv_track_data_accuracy(self, sample_playlists, tmp_path):
         """Test CSV track data is accurate"""
         exporter = CSVExporter()
         playlist = sample_playlists[0]  # My Favorite Songs
+        out_file = tmp_path / "out.csv"
         
-        csv_string = await exporter.export_to_string([playlist])
-        lines = csv_string.strip().split('\n')
+        exporter.export_playlists([playlist], str(out_file))
+        csv_string = out_file.read_text(encoding='utf-8')
         
         # Parse CSV
-        reader = csv.DictReader(lines)
+        reader = csv.DictReader(StringIO(csv_string))
         tracks = list(reader)
         
         assert len(tracks) == 3
         
         # Check first track data
         first_track = tracks[0]
-        assert first_track["track_name"] == "Bohemian Rhapsody"
-        assert first_track["artist_name"] == "Queen"
-        assert first_track["album_name"] == "A Night at the Opera"
-        assert int(first_track["duration_ms"]) == 354000
+        assert first_track["track_name"] == "cardigan"
+        assert first_track["artist_names"] == "Taylor Swift"
+        assert first_track["album_name"] == "folklore"
+        assert int(first_track["track_duration_ms"]) == 239560
         assert int(first_track["track_number"]) == 1
         
-    @pytest.mark.asyncio
-    async def test_csv_multiple_artists_handling(self, sample_playlists):
+    def test_csv_multiple_artists_handling(self, sample_playlists, tmp_path):
         """Test how CSV handles tracks with multiple artists"""
         exporter = CSVExporter()
+        out_file = tmp_path / "out.csv"
         
         # Find a track with multiple artists (if any exist in mock data)
         # For now, test with existing single-artist tracks
-        csv_string = await exporter.export_to_string([sample_playlists[0]])
+        exporter.export_playlists([sample_playlists[0]], str(out_file))
+        csv_string = out_file.read_text(encoding='utf-8')
         
         # Ensure no errors and proper formatting
-        lines = csv_string.strip().split('\n')
-        reader = csv.DictReader(lines)
+        reader = csv.DictReader(StringIO(csv_string))
         tracks = list(reader)
         
         # All tracks should have artist names
         for track in tracks:
-            assert len(track["artist_name"]) > 0
+            assert len(track["artist_names"]) > 0
             
-    @pytest.mark.asyncio
-    async def test_csv_export_empty_playlist_list(self):
-        """Test exporting empty playlist list to CSV"""
-        exporter = CSVExporter()
-        
-        csv_string = await exporter.export_to_string([])
-        
-        # Should still have header
-        lines = csv_string.strip().split('\n')
-        assert len(lines) == 1  # Only header
-        
-        header = lines[0]
-        assert "playlist_name" in header
-        
-    @pytest.mark.asyncio
-    async def test_csv_special_characters(self, sample_playlists):
+    def test_csv_special_characters(self, sample_playlists, tmp_path):
         """Test CSV handles special characters properly"""
         exporter = CSVExporter()
+        out_file = tmp_path / "out.csv"
         
         # The mock data should include some special characters
-        csv_string = await exporter.export_to_string(sample_playlists)
-        
-        # Should not crash and should be parseable
-        lines = csv_string.strip().split('\n')
-        reader = csv.DictReader(lines)
-        tracks = list(reader)
-        
-        # Verify we can read all tracks without issues
-        assert len(tracks) == 6  # 3 + 2 + 1 tracks total
+        exporter.export_playlists(sample_playlists, str(out_file))
+        with open(out_file, 'r', newline='', encoding='utf-8') as f:
+            csv_string = f.read()
         
-        # Check that CSV properly escapes any special characters
-        for track in tracks:
-            # Should not have unescaped quotes or commas breaking the format
-            assert track["playlist_name"] is not None
-            assert track["track_name"] is not None
+        # Unescaped quotes or newlines would break the one-line-per-row layout
+        assert csv_string.count('\n') == 7  # Header + 3 + 2 + 1 tracks
 
 
 class TestExporterIntegration:
     """Integration tests for exporters"""
     
-    @pytest.fixture
-    async def full_interface(self):
-        """Create interface with all playlists loaded"""
-        service = MockSpotifyService()
-        await service.initialize()
-        interface = PlaylistInterface(service)
-        await interface.load_playlists()
-        return interface
-    
-    @pytest.mark.asyncio
-    async def test_json_csv_export_consistency(self, full_interface):
-        """Test that JSON and CSV exports contain consistent data"""
-        selected_playlists = full_interface.playlists[:2]
+    @pytest.mark.parametrize("export_format,parser", [
+        ("json", json_loads),
+        ("csv", _parse_csv),
+    ])
+    def test_export_to_string(self, sample_playlists, exported_two_playlists, export_format, parser):
+        """Test exporting playlists to a string in each format"""
+        selected_playlists = sample_playlists[:2]  # First two playlists
         
-        json_exporter = JSONExporter()
-        csv_exporter = CSVExporter()
+        exported = exported_two_playlists[export_format]
+        assert exported is not None
+        assert len(exported) > 0
+        
+        parsed = parser(exported)
+        if isinstance(parsed, dict):
+            assert "export_timestamp" in parsed
+            assert "playlists" in parsed
+            assert len(parsed["playlists"]) == 2
+            assert parsed["total_playlists"] == 2
+            
+            track_count = sum(len(p["tracks"]) for p in parsed["playlists"])
+        else:
+            # Check header
+            expected_columns = [
+                "playlist_name", "playlist_id", "playlist_type", "track_name",
+                "track_id", "artist_names", "album_name", "track_duration_ms", "track_number"
+            ]
+            
+            missing = set(expected_columns) - set(parsed[0])
+            assert not missing, f"missing CSV columns: {missing}"
+            
+            track_count = len(parsed)
         
-        json_string = await json_exporter.export_to_string(selected_playlists)
-        csv_string = await csv_exporter.export_to_string(selected_playlists)
+        assert track_count == sum(p.track_count for p in selected_playlists) == 5  # 3 + 2
+    
+    @pytest.mark.parametrize("exporter_cls,export_format", [
+        (JSONExporter, "json"),
+        (CSVExporter, "csv"),
+    ])
+    def test_empty_export(self, exporter_cls, export_format, tmp_path):
+        """Test exporting an empty playlist list in each format"""
+        out_file = tmp_path / f"empty.{export_format}"
+        exporter_cls().export_playlists([], str(out_file))
+        
+        if export_format == "json":
+            data = json_loads(out_file.read_bytes())
+            assert data["total_playlists"] == 0
+            assert data["playlists"] == []
+        else:
+            # Should still have header
+            lines = out_file.read_text(encoding='utf-8').strip().split('\n')
+            assert len(lines) == 1  # Only header
+            
+            missing = {"playlist_name"} - set(h.strip() for h in lines[0].split(','))
+            assert not missing, f"missing CSV columns: {missing}"
+    
+    def test_json_csv_export_consistency(self, exported_two_playlists):
+        """Test that JSON and CSV exports contain consistent data"""
+        json_string = exported_two_playlists["json"]
+        csv_string = exported_two_playlists["csv"]
         
         # Parse both formats
-        json_data = json.loads(json_string)
-        csv_lines = csv_string.strip().split('\n')
-        csv_reader = csv.DictReader(csv_lines)
+        json_data = json_loads(json_string)
+        csv_reader = csv.DictReader(StringIO(csv_string))
         csv_tracks = list(csv_reader)
         
         # Count total tracks in JSON
@@ -314,18 +251,20 @@ class TestExporterIntegration:
         
         # Should have same number of tracks
         assert json_track_count == len(csv_tracks)
-        assert json_data["export_metadata"]["total_tracks"] == len(csv_tracks)
+        assert sum(p["track_count"] for p in json_data["playlists"]) == len(csv_tracks)
         
-    @pytest.mark.asyncio
-    async def test_export_with_selection(self, full_interface):
+    def test_export_with_selection(self, full_interface, tmp_path, monkeypatch):
         """Test exporting with different playlist selections"""
         # Test exporting owned playlists only
-        owned_playlists = full_interface.select_playlists_by_type(full_interface.playlists[0].playlist_type)
+        monkeypatch.setattr("builtins.input", lambda prompt="": "1")
+        owned_playlists = full_interface._handle_type_selection()
+        out_file = tmp_path / "owned.json"
         
         json_exporter = JSONExporter()
-        json_string = await json_exporter.export_to_string(owned_playlists)
-        data = json.loads(json_string)
+        json_exporter.export_playlists(owned_playlists, str(out_file))
+        data = json_loads(out_file.read_bytes())
         
         # Should only include owned playlists
+        assert len(data["playlists"]) == 2
         for playlist in data["playlists"]:
-            assert playlist["playlist_type"] == "owned"
\ No newline at end of file
+            assert playlist["type"] == "owned"
@@ -0,0 +1,37 @@
+import time
+from services.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    """Test suite for RateLimiter"""
+    
+    async def test_burst_is_not_delayed(self):
+        """Test a full bucket lets a burst through without waiting"""
+        limiter = RateLimiter(rate=1, burst=5)
+        
+        start = time.monotonic()
+        for _ in range(5):
+            await limiter.acquire()
+        
+        assert time.monotonic() - start < 0.5
+    
+    async def test_penalize_holds_requests(self):
+        """Test penalize() makes the next acquire wait out the pause"""
+        limiter = RateLimiter(rate=1000, burst=5)
+        
+        limiter.penalize(0.1)
+        start = time.monotonic()
+        await limiter.acquire()
+        
+        assert time.monotonic() - start >= 0.1
+    
+    def test_penalize_empties_bucket(self):
+        """Test the bucket refills from empty once the pause ends"""
+        limiter = RateLimiter(rate=10, burst=5)
+        
+        limiter.penalize(30)
+        limiter.penalize(1)  # A shorter pause never shortens the current one
+        
+        assert limiter._tokens == 0
+        assert limiter._paused_until == limiter._updated
+        assert limiter._paused_until - time.monotonic() > 29
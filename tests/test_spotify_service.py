@@ -0,0 +1,277 @@
+import json
+import pytest
+from services.base import MusicServiceError, RateLimitError
+from services.spotify_service import SpotifyService
+
+
+def _playlist_item(playlist_id, snapshot_id, track_total=1):
+    """Raw /me/playlists item as Spotify returns it"""
+    return {
+        "id": playlist_id,
+        "name": f"Playlist {playlist_id}",
+        "uri": f"spotify:playlist:{playlist_id}",
+        "owner": {"id": "me", "display_name": "Me", "uri": "spotify:user:me"},
+        "tracks": {"total": track_total},
+        "snapshot_id": snapshot_id,
+    }
+
+
+def _track_item(track_id):
+    """Raw playlist track item as Spotify returns it"""
+    return {
+        "added_at": "2024-01-01T00:00:00Z",
+        "track": {
+            "id": track_id,
+            "name": f"Track {track_id}",
+            "uri": f"spotify:track:{track_id}",
+            "duration_ms": 1000,
+            "artists": [{"id": "artist", "name": "Artist", "uri": "spotify:artist:artist"}],
+            "album": {"id": "album", "name": "Album", "uri": "spotify:album:album"},
+        },
+    }
+
+
+class FakeSpotifyAPI:
+    """Stand-in for SpotifyService._make_request that serves a fixed library"""
+    
+    def __init__(self, snapshots):
+        # Playlist ID -> current snapshot_id; every playlist holds one track named after it
+        self.snapshots = snapshots
+        self.track_requests = []
+    
+    async def __call__(self, method, endpoint, params=None, json_data=None):
+        if endpoint == "/me/playlists":
+            items = [_playlist_item(pid, snapshot) for pid, snapshot in self.snapshots.items()]
+            return {"items": items, "next": None, "total": len(items)}
+        
+        playlist_id = endpoint.split("/")[2]
+        self.track_requests.append(playlist_id)
+        return {"items": [_track_item(f"{playlist_id}_track")], "next": None, "total": 1}
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    return tmp_path / "cache" / "spotify_playlist_cache.json"
+
+
+def _service(cache_file, api, monkeypatch):
+    """Authenticated SpotifyService reading its library from the fake API"""
+    service = SpotifyService(cache_file=str(cache_file))
+    service._authenticated = True
+    service._user_id = "me"
+    monkeypatch.setattr(service, "_make_request", api)
+    return service
+
+
+def _read_cache(cache_file):
+    return json.loads(cache_file.read_text(encoding="utf-8"))
+
+
+class TestSnapshotCache:
+    """Test the snapshot_id keyed track cache"""
+    
+    async def test_miss_then_hit(self, cache_file, monkeypatch):
+        """Test tracks are fetched on a miss and rebuilt from the cache on a hit"""
+        api = FakeSpotifyAPI({"a": "s1", "b": "s1"})
+        first = await _service(cache_file, api, monkeypatch).get_user_playlists()
+        
+        assert sorted(api.track_requests) == ["a", "b"]
+        assert set(_read_cache(cache_file)) == {"a", "b"}
+        
+        # A new service starts from the file on disk
+        api.track_requests.clear()
+        second = await _service(cache_file, api, monkeypatch).get_user_playlists()
+        
+        assert api.track_requests == []
+        assert [[t.name for t in p.tracks] for p in second] == [[t.name for t in p.tracks] for p in first]
+    
+    async def test_threaded_rebuild_merges_parse_caches(self, cache_file, monkeypatch):
+        """Test a cache hit parsed in a worker thread shares and keeps its artists"""
+        api = FakeSpotifyAPI({"a": "s1", "b": "s1"})
+        await _service(cache_file, api, monkeypatch).get_user_playlists()
+        
+        service = _service(cache_file, api, monkeypatch)
+        monkeypatch.setattr(service, "THREAD_PARSE_MIN_ITEMS", 1)
+        playlists = await service.get_user_playlists()
+        
+        first, second = (p.tracks[0] for p in playlists)
+        assert first.artists[0] is second.artists[0]
+        assert service._artist_cache["artist"] is first.artists[0]
+        assert service._album_cache["album"] is first.album
+    
+    async def test_changed_snapshot_is_refetched(self, cache_file, monkeypatch):
+        """Test only playlists whose snapshot_id changed are fetched again"""
+        api = FakeSpotifyAPI({"a": "s1", "b": "s1"})
+        await _service(cache_file, api, monkeypatch).get_user_playlists()
+        
+        api.snapshots["b"] = "s2"
+        api.track_requests.clear()
+        await _service(cache_file, api, monkeypatch).get_user_playlists()
+        
+        assert api.track_requests == ["b"]
+        assert _read_cache(cache_file)["b"]["snapshot_id"] == "s2"
+    
+    async def test_stale_playlists_are_pruned(self, cache_file, monkeypatch):
+        """Test playlists that left the library are dropped from the cache"""
+        api = FakeSpotifyAPI({"a": "s1", "gone": "s1"})
+        await _service(cache_file, api, monkeypatch).get_user_playlists()
+        
+        del api.snapshots["gone"]
+        await _service(cache_file, api, monkeypatch).get_user_playlists()
+        
+        assert set(_read_cache(cache_file)) == {"a"}
+    
+    async def test_limited_listing_keeps_unlisted_playlists(self, cache_file, monkeypatch):
+        """Test a limited listing doesn't prune playlists it didn't see"""
+        api = FakeSpotifyAPI({"a": "s1", "b": "s1"})
+        await _service(cache_file, api, monkeypatch).get_user_playlists()
+        
+        await _service(cache_file, api, monkeypatch).get_user_playlists(limit=1)
+        
+        assert set(_read_cache(cache_file)) == {"a", "b"}
+    
+    @pytest.mark.parametrize("contents", [
+        None,  # Missing file
+        "{not json",
+        "[]",
+        json.dumps({"a": {"snapshot_id": "s1"}, "b": "s1"}),  # Entries without items
+    ], ids=["missing", "invalid-json", "not-a-dict", "malformed-entries"])
+    async def test_unusable_cache_is_refetched(self, cache_file, monkeypatch, contents):
+        """Test a missing or malformed cache falls back to the API"""
+        if contents is not None:
+            cache_file.parent.mkdir(parents=True)
+            cache_file.write_text(contents, encoding="utf-8")
+        api = FakeSpotifyAPI({"a": "s1", "b": "s1"})
+        
+        playlists = await _service(cache_file, api, monkeypatch).get_user_playlists()
+        
+        assert sorted(api.track_requests) == ["a", "b"]
+        assert [len(p.tracks) for p in playlists] == [1, 1]
+        assert set(_read_cache(cache_file)) == {"a", "b"}
+    
+    async def test_unchanged_library_skips_write(self, cache_file, monkeypatch):
+        """Test the cache file isn't rewritten when nothing changed"""
+        api = FakeSpotifyAPI({"a": "s1"})
+        await _service(cache_file, api, monkeypatch).get_user_playlists()
+        
+        service = _service(cache_file, api, monkeypatch)
+        saves = []
+        monkeypatch.setattr(service, "_save_track_cache", lambda: saves.append(True))
+        await service.get_user_playlists()
+        
+        assert saves == []
+
+
+class FakeResponse:
+    """Just enough of aiohttp's response for _make_request"""
+    
+    def __init__(self, status, body=b"{}", headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    async def read(self):
+        return self.body
+    
+    async def text(self):
+        return self.body.decode()
+
+
+class FakeSession:
+    """Hands out the queued responses one request at a time"""
+    
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = 0
+    
+    def request(self, method, url, **kwargs):
+        self.requests += 1
+        return self.responses.pop(0)
+
+
+class TestRequestRetries:
+    """Test _make_request's handling of 429 and 5xx responses"""
+    
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """Record backoff sleeps instead of waiting; jitter is pinned to zero"""
+        delays = []
+        
+        async def fake_sleep(delay):
+            delays.append(delay)
+        
+        monkeypatch.setattr("services.spotify_service.asyncio.sleep", fake_sleep)
+        monkeypatch.setattr("services.spotify_service.random.random", lambda: 0.0)
+        return delays
+    
+    def _service(self, tmp_path, monkeypatch, responses):
+        service = SpotifyService(cache_file=str(tmp_path / "cache.json"))
+        session = FakeSession(responses)
+        
+        async def access_token():
+            return "token"
+        
+        async def ensure_session():
+            return session
+        
+        monkeypatch.setattr(service.authenticator, "ensure_access_token", access_token)
+        monkeypatch.setattr(service, "_ensure_session", ensure_session)
+        return service, session
+    
+    async def test_server_error_is_retried(self, tmp_path, monkeypatch, sleeps):
+        """Test a 5xx response is retried with exponential backoff"""
+        service, session = self._service(tmp_path, monkeypatch, [
+            FakeResponse(503), FakeResponse(502), FakeResponse(200, b'{"ok": true}'),
+        ])
+        
+        assert await service._make_request("GET", "/me") == {"ok": True}
+        assert session.requests == 3
+        assert sleeps == [1.0, 2.0]
+    
+    async def test_rate_limit_penalizes_and_retries(self, tmp_path, monkeypatch, sleeps):
+        """Test a 429 pauses the shared rate limiter for Retry-After, then retries"""
+        service, session = self._service(tmp_path, monkeypatch, [
+            FakeResponse(429, headers={"Retry-After": "7"}), FakeResponse(200, b'{"ok": true}'),
+        ])
+        penalties = []
+        monkeypatch.setattr(service.rate_limiter, "penalize", penalties.append)
+        
+        assert await service._make_request("GET", "/me") == {"ok": True}
+        assert penalties == [7]
+        assert sleeps == []  # The rate limiter does the waiting
+    
+    @pytest.mark.parametrize("status,error", [
+        (500, MusicServiceError),
+        (429, RateLimitError),
+    ])
+    async def test_gives_up_after_max_retries(self, tmp_path, monkeypatch, sleeps, status, error):
+        """Test the error is raised once the retries are used up"""
+        attempts = SpotifyService.MAX_RETRIES + 1
+        service, session = self._service(tmp_path, monkeypatch, [FakeResponse(status)] * attempts)
+        monkeypatch.setattr(service.rate_limiter, "penalize", lambda seconds: None)
+        
+        with pytest.raises(error):
+            await service._make_request("GET", "/me")
+        assert session.requests == attempts
+
+
+class TestParseAlbum:
+    """Test album parsing"""
+    
+    @pytest.mark.parametrize("album_data,expected", [
+        ({}, "album"),
+        ({"album_type": "single"}, "single"),
+        ({"album_type": ""}, ""),
+        ({"album_type": None}, None),
+    ])
+    def test_album_type(self, tmp_path, album_data, expected):
+        """Test album_type defaults only when the key is missing"""
+        service = SpotifyService(cache_file=str(tmp_path / "cache.json"))
+        album = service._parse_album(album_data, {}, {})
+        assert album.album_type == expected